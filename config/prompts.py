@@ -1,9 +1,14 @@
 """
 AI prompt templates for generating titles and descriptions.
 Based on gallery owner and collector perspectives.
+
+The long instruction prompts are static so they can be sent as cached
+system blocks; per-painting details go in the user turn instead.
 """
 
-TITLE_GENERATION_PROMPT = """You are an experienced art gallery owner and curator. Analyze this painting image and generate 10 diverse, compelling titles.
+from typing import Optional
+
+_TITLE_GUIDELINES = """You are an experienced art gallery owner and curator. Analyze this painting image and generate 10 diverse, compelling titles.
 
 Requirements:
 1. Generate exactly 10 title options
@@ -28,18 +33,28 @@ Requirements:
    - Balance accessibility with intrigue
 
 4. Consider the artist's style: influenced by Pre-Raphaelite, British watercolourists, Japanese prints, Renaissance art
+"""
 
+TITLE_GENERATION_PROMPT = _TITLE_GUIDELINES + """
 Return ONLY a JSON array of 10 title strings, nothing else.
 Example format: ["Title One", "Title Two", "Title Three", "Title Four", "Title Five", "Title Six", "Title Seven", "Title Eight", "Title Nine", "Title Ten"]
 """
 
+TITLE_REQUEST_PROMPT = """Generate the 10 titles for this painting."""
+
+# Titles and category in one vision call, so the image is only uploaded once
+ANALYSIS_PROMPT = _TITLE_GUIDELINES + """
+5. Also choose which of the available categories (listed with the image) best fits this artwork.
+
+Return ONLY a JSON object with the keys "titles" (an array of 10 title strings) and "category" (one of the available category names), nothing else.
+Example format: {"titles": ["Title One", "Title Two", "Title Three", "Title Four", "Title Five", "Title Six", "Title Seven", "Title Eight", "Title Nine", "Title Ten"], "category": "Category Name"}
+"""
+
 DESCRIPTION_GENERATION_PROMPT = """You are an experienced art gallery owner writing a description for a collector/buyer.
 
-Painting Title: {title}
-Medium: {medium}
-Dimensions: {dimensions}
-Category: {category}
-{user_notes_section}
+You will be given the painting image along with its title, medium, dimensions,
+category and, optionally, the Artist's Notes.
+
 Write a compelling gallery description that includes:
 
 1. VISUAL ANALYSIS (2-3 sentences):
@@ -68,9 +83,50 @@ Keep the tone:
 Write the description in paragraph form, no bullet points or numbered lists.
 """
 
+
+def build_description_details(
+    title: str,
+    medium: str,
+    dimensions: str,
+    category: str,
+    user_notes: Optional[str] = None,
+) -> str:
+    """Build the per-painting user turn that accompanies the description prompt."""
+    user_notes_section = f"\nArtist's Notes: {user_notes}\n" if user_notes else ""
+    return (
+        f"Painting Title: {title}\n"
+        f"Medium: {medium}\n"
+        f"Dimensions: {dimensions}\n"
+        f"Category: {category}\n"
+        f"{user_notes_section}\n"
+        f"Write the gallery description for this painting.\n"
+    )
+
+
 CATEGORY_DETECTION_PROMPT = """Based on this image, which category best fits this artwork?
 
 Available categories: {categories}
 
 Return ONLY the category name, nothing else.
 """
+
+
+def build_category_choices(categories: list) -> str:
+    """Build the user turn listing the categories to choose from."""
+    return f"Available categories: {', '.join(categories)}"
+
+
+def _cached_system_blocks(prompt: str) -> list:
+    """Wrap a static prompt as a system block marked for prompt caching."""
+    return [
+        {
+            "type": "text",
+            "text": prompt,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+TITLE_SYSTEM_BLOCKS = _cached_system_blocks(TITLE_GENERATION_PROMPT)
+ANALYSIS_SYSTEM_BLOCKS = _cached_system_blocks(ANALYSIS_PROMPT)
+DESCRIPTION_SYSTEM_BLOCKS = _cached_system_blocks(DESCRIPTION_GENERATION_PROMPT)
@@ -4,11 +4,14 @@ All extensible lists are defined here for easy modification.
 """
 
 import os
+from functools import cache
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from the project's .env (the same file admin
+# mode edits). An explicit path skips find_dotenv's stack/directory search.
+ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+load_dotenv(ENV_FILE)
 
 # API Configuration
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "xxx")
@@ -16,6 +19,12 @@ ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "xxx")
 # FASO Configuration
 FASO_EMAIL = os.getenv("FASO_EMAIL", "xxx")
 FASO_PASSWORD = os.getenv("FASO_PASSWORD", "xxx")
+# Uploads run without a visible window; set FASO_HEADFUL=1 to watch them
+FASO_UPLOAD_HEADLESS = os.getenv("FASO_HEADFUL", "") != "1"
+# Paintings uploaded at once, each in its own tab. FASO keeps the upload ->
+# Continue -> metadata form flow in one server-side session, so parallel tabs
+# can attach metadata to the wrong image; only raise this if that is ruled out.
+FASO_UPLOAD_CONCURRENCY = max(1, int(os.getenv("FASO_UPLOAD_CONCURRENCY", "1")))
 
 # Mastodon Configuration
 MASTODON_INSTANCE_URL = os.getenv("MASTODON_INSTANCE_URL", "")
@@ -75,6 +84,8 @@ VIDEOS_PATH = Path(os.getenv("VIDEOS_PATH", "~/ai-workzone/videos")).expanduser(
 # Browser cookies and session files
 COOKIES_DIR = Path(os.getenv("COOKIES_DIR", "~/.config/theo-van-gogh/cookies")).expanduser()
 FASO_COOKIES_PATH = COOKIES_DIR / "faso_cookies.json"
+# Saved FASO sessions older than this are treated as expired without checking
+FASO_SESSION_TTL_SECONDS = 30 * 24 * 60 * 60
 INSTAGRAM_COOKIES_PATH = COOKIES_DIR / "instagram_cookies.json"
 LOGIN_STATUS_PATH = COOKIES_DIR / "login_status.json"
 
@@ -83,9 +94,27 @@ DEBUG_DIR = Path(os.getenv("DEBUG_DIR", "~/.config/theo-van-gogh/debug")).expand
 SCREENSHOTS_DIR = DEBUG_DIR / "screenshots"
 LOGS_DIR = Path(os.getenv("LOGS_DIR", "~/logs")).expanduser()
 
-# Ensure all directories exist
-for directory in [METADATA_OUTPUT_PATH, COOKIES_DIR, DEBUG_DIR, SCREENSHOTS_DIR, LOGS_DIR, VIDEOS_PATH]:
-    directory.mkdir(parents=True, exist_ok=True)
+# Cached AI results (titles/descriptions keyed by image content).
+# Kept outside METADATA_OUTPUT_PATH so metadata scans never see these files.
+AI_CACHE_DIR = Path(os.getenv("AI_CACHE_DIR", "~/.cache/theo-van-gogh/ai")).expanduser()
+
+# Index of the metadata fields the FASO upload menu needs, keyed on each
+# metadata file's mtime so unchanged files are not parsed again.
+FASO_INDEX_PATH = Path(
+    os.getenv("FASO_INDEX_PATH", "~/.cache/theo-van-gogh/faso_index.json")
+).expanduser()
+
+
+@cache
+def ensure_dir(directory: Path) -> Path:
+    """Create a working directory on first use. Runs once per path per process.
+
+    Directories are not created at import time, so importing settings (and
+    read-only commands like verify-config) never touch the filesystem;
+    code that writes into one of the paths above calls this first.
+    """
+    os.makedirs(directory, exist_ok=True)
+    return directory
 
 # ============================================================================
 # MEASUREMENT UNITS
@@ -168,13 +197,27 @@ COLLECTIONS = [
     "Fire Stars"
 ]
 
+# Freeze the option lists so no caller can mutate shared config at runtime.
+# The list literals above stay as they are because admin mode edits them in
+# place in this file.
+SUBSTRATES, MEDIUMS, SUBJECTS, STYLES, COLLECTIONS = (
+    tuple(SUBSTRATES),
+    tuple(MEDIUMS),
+    tuple(SUBJECTS),
+    tuple(STYLES),
+    tuple(COLLECTIONS),
+)
+
 # Image Processing Settings
-SUPPORTED_IMAGE_FORMATS = [".jpg", ".jpeg", ".png"]
+SUPPORTED_IMAGE_FORMATS = frozenset({".jpg", ".jpeg", ".png"})  # membership-tested per file
 MAX_IMAGE_SIZE_MB = 100  # Maximum file size for processing
 
 # AI Configuration
 CLAUDE_MODEL = "claude-sonnet-4-20250514"
 MAX_TOKENS = 2000
+AI_IMAGE_MAX_DIMENSION = 1024  # Longest side (px) of images sent to Claude; larger ones are downscaled
+TITLE_PREFETCH_COUNT = 3  # Paintings whose titles are generated ahead in the background
+AI_IMAGE_CACHE_SIZE = 32  # Prepared (downscaled, base64) images kept in memory for reuse
 
 # File Naming
 SANITIZE_RULES = {
@@ -192,3 +235,21 @@ SANITIZE_RULES = {
     ">": "",
     "|": "",
 }
+
+# Single-pass translation table for the one-character rules above
+# (an empty replacement deletes the character)
+SANITIZE_TRANSLATION = str.maketrans({
+    char: (replacement or None)
+    for char, replacement in SANITIZE_RULES.items()
+    if len(char) == 1
+})
+
+# Byte-level equivalents for the common all-ASCII title, where
+# bytes.translate is cheaper than str.translate
+SANITIZE_ASCII_TABLE = bytes.maketrans(
+    "".join(c for c, r in SANITIZE_RULES.items() if len(c) == 1 and len(r) == 1).encode("ascii"),
+    "".join(r for c, r in SANITIZE_RULES.items() if len(c) == 1 and len(r) == 1).encode("ascii"),
+)
+SANITIZE_ASCII_DELETE = "".join(
+    c for c, r in SANITIZE_RULES.items() if len(c) == 1 and not r
+).encode("ascii")
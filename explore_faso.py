@@ -11,7 +11,7 @@ from pathlib import Path
 from playwright.async_api import async_playwright
 from rich.console import Console
 
-from config.settings import COOKIES_DIR, SCREENSHOTS_DIR, PAINTINGS_BIG_PATH, SUPPORTED_IMAGE_FORMATS
+from config.settings import COOKIES_DIR, SCREENSHOTS_DIR, PAINTINGS_BIG_PATH, SUPPORTED_IMAGE_FORMATS, ensure_dir
 
 console = Console()
 
@@ -182,4 +182,5 @@ async def explore():
 
 
 if __name__ == "__main__":
+    ensure_dir(SCREENSHOTS_DIR)
     asyncio.run(explore())
@@ -4,24 +4,33 @@ Theo-van-Gogh - Main CLI Entry Point
 Orchestrates the complete painting processing workflow.
 """
 
+import queue
 import sys
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
 import click
-from rich.console import Console
 from rich.prompt import Confirm
 
-from src.app.services.image_analyzer import ImageAnalyzer
-from src.app.services.file_manager import FileManager
-from src.app.services.metadata_manager import MetadataManager
-from src.app.services.cli_interface import CLIInterface
-from src.app.services.admin_mode import AdminMode
+from src.app.services.cli_interface import CLIInterface, console
 from src.core.logger import configure_logging, get_logger
-from config.settings import PAINTINGS_BIG_PATH, PAINTINGS_INSTAGRAM_PATH
+
+# The Anthropic SDK, PIL and admin-mode dependencies are only imported by the
+# commands that use them, so --help and the lightweight commands start fast.
+if TYPE_CHECKING:
+    from src.app.services.file_manager import FileManager
+    from src.app.services.image_analyzer import ImageAnalyzer
+    from src.app.services.metadata_manager import MetadataManager
+from config.settings import (
+    COLLECTIONS,
+    PAINTINGS_BIG_PATH,
+    PAINTINGS_INSTAGRAM_PATH,
+    SCREENSHOTS_DIR,
+    TITLE_PREFETCH_COUNT,
+)
 
 
-console = Console()
-configure_logging()
 _log = get_logger("cli")
 
 
@@ -29,32 +38,39 @@ _log = get_logger("cli")
 @click.pass_context
 def cli(ctx):
     """Theo-van-Gogh - Automated painting metadata generation and management."""
+    # Set up the log file here rather than at import, so --help never opens it
+    configure_logging()
     if ctx.invoked_subcommand is None:
         # Show admin mode option at startup
         console.print("\n[bold cyan]Theo-van-Gogh[/bold cyan]\n")
         
         if Confirm.ask("Enter admin mode?", default=False):
+            from src.app.services.admin_mode import AdminMode
             settings_path = Path(__file__).parent / "config" / "settings.py"
             admin = AdminMode(settings_path)
             admin.run()
             console.print("\n")
         
         # After admin mode (or if skipped), show available commands
-        console.print("Available commands:")
-        console.print("  [cyan]python main.py process[/cyan]       - Process paintings")
-        console.print("  [cyan]python main.py verify-config[/cyan]  - Verify configuration")
-        console.print("  [cyan]python main.py admin[/cyan]          - Enter admin mode")
-        console.print("  [cyan]python main.py upload-faso[/cyan]    - Upload to FASO")
-        console.print("  [cyan]python main.py post-social[/cyan]   - Post to social media")
-        console.print("  [cyan]python main.py schedule-post[/cyan]  - Schedule a post")
-        console.print("  [cyan]python main.py check-schedule[/cyan] - Run scheduled posts")
-        console.print("  [cyan]python main.py daily-post[/cyan]     - Daily automated posting")
-        console.print("\nRun with --help for more information")
+        console.print(
+            "Available commands:\n"
+            "  [cyan]python main.py process[/cyan]       - Process paintings\n"
+            "  [cyan]python main.py verify-config[/cyan]  - Verify configuration\n"
+            "  [cyan]python main.py admin[/cyan]          - Enter admin mode\n"
+            "  [cyan]python main.py upload-faso[/cyan]    - Upload to FASO\n"
+            "  [cyan]python main.py post-social[/cyan]   - Post to social media\n"
+            "  [cyan]python main.py schedule-post[/cyan]  - Schedule a post\n"
+            "  [cyan]python main.py check-schedule[/cyan] - Run scheduled posts\n"
+            "  [cyan]python main.py daily-post[/cyan]     - Daily automated posting\n"
+            "\nRun with --help for more information"
+        )
 
 
 @cli.command()
 def admin():
     """Enter admin mode to edit configuration settings."""
+    from src.app.services.admin_mode import AdminMode
+
     settings_path = Path(__file__).parent / "config" / "settings.py"
     admin_mode = AdminMode(settings_path)
     admin_mode.run()
@@ -70,6 +86,10 @@ def process():
     Example:
         python main.py process
     """
+    from src.app.services.file_manager import FileManager
+    from src.app.services.image_analyzer import ImageAnalyzer
+    from src.app.services.metadata_manager import MetadataManager
+
     try:
         # Initialize components
         ui = CLIInterface()
@@ -103,20 +123,73 @@ def process():
         
         ui.print_info(f"Found {len(painting_pairs)} painting(s)")
         
-        # Process each painting
+        # Process each painting. The AI analysis (titles and suggested
+        # collection) only needs the image, so it is fetched for the next few
+        # paintings in the background while the user answers the prompts.
         processed_filenames = []
-        for big_file, instagram_file in painting_pairs:
-            result = process_single_painting(
-                big_file,
-                instagram_file,
-                category,
-                ui,
-                file_mgr,
-                analyzer,
-                metadata_mgr,
+        executor = ThreadPoolExecutor(max_workers=TITLE_PREFETCH_COUNT)
+        analysis_futures = {}
+
+        # The description gets its own worker so it never queues behind the
+        # analysis prefetches above
+        describer = ThreadPoolExecutor(max_workers=1)
+
+        # Metadata files are written by a single background thread so the
+        # next painting can start while the previous one is saved to disk.
+        writer = ThreadPoolExecutor(max_workers=1)
+        pending_writes = []
+
+        def prefetch_analysis(index: int) -> None:
+            if index >= len(painting_pairs) or index in analysis_futures:
+                return
+            big_file, instagram_file = painting_pairs[index]
+            # Already processed paintings are usually skipped; analyse them
+            # on demand if the user chooses to reprocess
+            if metadata_mgr.metadata_exists(category, big_file.stem):
+                return
+            analysis_futures[index] = executor.submit(
+                analyzer.analyze_full,
+                _analysis_file(big_file, instagram_file),
+                COLLECTIONS,
             )
-            if result:  # If processing succeeded
-                processed_filenames.append(result)
+
+        try:
+            for index in range(TITLE_PREFETCH_COUNT):
+                prefetch_analysis(index)
+
+            for index, (big_file, instagram_file) in enumerate(painting_pairs):
+                # A failed save raises here, before more paintings are
+                # processed on top of it, rather than only after the loop
+                for write in [write for write in pending_writes if write.done()]:
+                    pending_writes.remove(write)
+                    write.result()
+                prefetch_analysis(index + TITLE_PREFETCH_COUNT)
+                analysis_future = analysis_futures.pop(index, None)
+                result = process_single_painting(
+                    big_file,
+                    instagram_file,
+                    category,
+                    ui,
+                    file_mgr,
+                    analyzer,
+                    metadata_mgr,
+                    analysis_future=analysis_future,
+                    ai_executor=describer,
+                    writer=writer,
+                    pending_writes=pending_writes,
+                )
+                if analysis_future is not None:
+                    analysis_future.cancel()  # no-op unless the painting was skipped early
+                if result:  # If processing succeeded
+                    processed_filenames.append(result)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            describer.shutdown(wait=False, cancel_futures=True)
+            writer.shutdown(wait=True)
+
+        # Surface any failed write still outstanding before files are organised
+        for write in pending_writes:
+            write.result()
         
         ui.print_success(f"\nProcessing complete! Processed {len(processed_filenames)} painting(s)")
         
@@ -149,17 +222,21 @@ def process():
             from config.settings import UPLOAD_TRACKER_PATH
             tracker = UploadTracker(UPLOAD_TRACKER_PATH)
             
+            # After organizing, metadata is in a collection folder; the
+            # organizer reports where. Paintings it could not move still
+            # have their metadata in the category folder.
+            metadata_index = results["metadata_paths"]
             for filename in processed_filenames:
-                metadata_file = METADATA_OUTPUT_PATH / "new-paintings" / f"{filename}.json"
-                # After organizing, metadata is in collection folder
-                # We need to find it
-                import json
-                for collection_folder in METADATA_OUTPUT_PATH.iterdir():
-                    if collection_folder.is_dir():
-                        candidate = collection_folder / f"{filename}.json"
-                        if candidate.exists():
-                            tracker.add_painting(filename, str(candidate))
-                            break
+                if filename not in metadata_index:
+                    unmoved = METADATA_OUTPUT_PATH / category / f"{filename}.json"
+                    if unmoved.exists():
+                        metadata_index[filename] = unmoved
+            
+            tracker.add_paintings(
+                (filename, str(metadata_index[filename]))
+                for filename in processed_filenames
+                if filename in metadata_index
+            )
             
             pending = tracker.get_all_pending()
             ui.print_success(f"\nUpload tracker updated")
@@ -176,14 +253,42 @@ def process():
         sys.exit(1)
 
 
+def _analysis_file(big_file: Path, instagram_file: Optional[Path]) -> Path:
+    """Prefer the (smaller) Instagram version for AI analysis, else the big one."""
+    return instagram_file if instagram_file and instagram_file.exists() else big_file
+
+
+def _print_streamed(future: Future, chunks: "queue.SimpleQueue[str]", ui: CLIInterface) -> str:
+    """
+    Print the text a background job has streamed so far, then the rest as it arrives.
+
+    Args:
+        future: Future of the job, which puts each text chunk on chunks
+        chunks: Queue the job streams its text into
+        ui: CLI interface to print on
+
+    Returns:
+        The job's result
+    """
+    # Every chunk is queued before the future completes, so None marks the end
+    future.add_done_callback(lambda _: chunks.put(None))
+    for chunk in iter(chunks.get, None):
+        ui.print_stream(chunk)
+    return future.result()
+
+
 def process_single_painting(
     big_file: Path,
     instagram_file: Path,
     category: str,
     ui: CLIInterface,
-    file_mgr: FileManager,
-    analyzer: ImageAnalyzer,
-    metadata_mgr: MetadataManager,
+    file_mgr: "FileManager",
+    analyzer: "ImageAnalyzer",
+    metadata_mgr: "MetadataManager",
+    analysis_future: Optional[Future] = None,
+    ai_executor: Optional[Executor] = None,
+    writer: Optional[Executor] = None,
+    pending_writes: Optional[List[Future]] = None,
 ) -> str:
     """
     Process a single painting through the complete workflow.
@@ -196,6 +301,10 @@ def process_single_painting(
         file_mgr: File manager
         analyzer: Image analyzer
         metadata_mgr: Metadata manager
+        analysis_future: Prefetched result of analyzer.analyze_full (optional)
+        ai_executor: Executor to start the description on early (generated inline if None)
+        writer: Executor to save metadata files on (saves inline if None)
+        pending_writes: List collecting the futures of background saves
     """
     ui.print_header(f"\nProcessing: {big_file.name}")
     ui.show_file_info(big_file, instagram_file)
@@ -218,17 +327,22 @@ def process_single_painting(
     try:
         # Import DIMENSION_UNIT from settings
         from config.settings import DIMENSION_UNIT
+        from src.app.services.metadata_manager import PaintingDetails
         
         # Determine which file to use for AI analysis
         # Prefer Instagram version (smaller), fallback to big if not available
-        analyze_file = instagram_file if instagram_file and instagram_file.exists() else big_file
+        analyze_file = _analysis_file(big_file, instagram_file)
         
         if analyze_file == big_file and not instagram_file:
             ui.print_warning("No Instagram version found - using big version for analysis")
         
         # Step 1: Generate AI titles first
         ui.print_info("Generating AI titles...")
-        ai_titles = analyzer.generate_titles(analyze_file)
+        if analysis_future is not None:
+            analysis = analysis_future.result()
+        else:
+            analysis = analyzer.analyze_full(analyze_file, COLLECTIONS)
+        ai_titles = analysis["titles"]
 
         # Step 2: Show AI titles and let user select or enter custom
         selected_title, all_titles = ui.select_or_custom_title(ai_titles)
@@ -245,6 +359,25 @@ def process_single_painting(
         # Step 5: User selects medium
         medium = ui.select_medium()
         
+        # Every input the description needs is known now, so start it in the
+        # background while the user answers the remaining prompts
+        full_medium = f"{medium} on {substrate}"
+        description_future = None
+        if ai_executor is not None:
+            # Streamed text waits here until the prompts are done, so the
+            # worker never writes over an open prompt
+            description_chunks = queue.SimpleQueue()
+            description_future = ai_executor.submit(
+                analyzer.generate_description,
+                analyze_file,  # Use Instagram version for analysis
+                selected_title,
+                full_medium,
+                dimensions_formatted,
+                category,
+                user_notes=user_notes,
+                on_text=description_chunks.put,
+            )
+        
         # Step 6: User selects subject
         subject = ui.select_subject()
         
@@ -252,7 +385,7 @@ def process_single_painting(
         style = ui.select_style()
         
         # Step 8: User selects collection
-        collection = ui.select_collection()
+        collection = ui.select_collection(suggested=analysis["category"])
         
         # Step 9: User inputs price
         price = ui.input_price(default=0.0)
@@ -261,18 +394,36 @@ def process_single_painting(
         suggested_date = file_mgr.get_creation_date(big_file)
         creation_date = ui.input_creation_date(suggested_date)
         
+        details = PaintingDetails(
+            width=width,
+            height=height,
+            depth=depth,
+            dimension_unit=DIMENSION_UNIT,
+            dimensions_formatted=dimensions_formatted,
+            substrate=substrate,
+            medium=medium,
+            subject=subject,
+            style=style,
+            collection=collection,
+            price_eur=price,
+            creation_date=creation_date,
+        )
+        
         # Step 11: Generate description
         ui.print_info("Generating description...")
-        # Build full medium description for AI
-        full_medium = f"{medium} on {substrate}"
-        description = analyzer.generate_description(
-            analyze_file,  # Use Instagram version for analysis
-            selected_title,
-            full_medium,
-            dimensions_formatted,
-            category,
-            user_notes=user_notes,
-        )
+        if description_future is not None:
+            description = _print_streamed(description_future, description_chunks, ui)
+        else:
+            description = analyzer.generate_description(
+                analyze_file,  # Use Instagram version for analysis
+                selected_title,
+                full_medium,
+                dimensions_formatted,
+                category,
+                user_notes=user_notes,
+                on_text=ui.print_stream,
+            )
+        ui.console.print()
         
         # Step 12: Rename files
         ui.print_info("Renaming files...")
@@ -293,27 +444,20 @@ def process_single_painting(
             selected_title=selected_title,
             all_titles=all_titles,  # Changed from 'titles'
             description=description,
-            width=width,
-            height=height,
-            depth=depth,
-            dimension_unit=DIMENSION_UNIT,
-            dimensions_formatted=dimensions_formatted,
-            substrate=substrate,
-            medium=medium,
-            subject=subject,
-            style=style,
-            collection=collection,
-            price_eur=price,
-            creation_date=creation_date,
+            details=details,
             analyzed_from="instagram" if analyze_file == instagram_file else "big",
         )
         
         # Step 14: Save metadata files
-        json_path = metadata_mgr.save_metadata_json(metadata, category)
-        txt_path = metadata_mgr.save_metadata_text(metadata, category)
-        
-        ui.print_success(f"Metadata saved: {json_path.name}")
-        ui.print_success(f"Text file saved: {txt_path.name}")
+        if writer is not None:
+            pending_writes.append(
+                writer.submit(metadata_mgr.save_metadata_files, metadata, category)
+            )
+            ui.print_info(f"Saving metadata: {sanitized_name}.json, {sanitized_name}.txt")
+        else:
+            json_path, txt_path = metadata_mgr.save_metadata_files(metadata, category)
+            ui.print_success(f"Metadata saved: {json_path.name}")
+            ui.print_success(f"Text file saved: {txt_path.name}")
         
         # Show summary
         ui.show_processing_summary(metadata)
@@ -329,6 +473,8 @@ def process_single_painting(
 @cli.command()
 def list_categories():
     """List all available categories."""
+    from src.app.services.file_manager import FileManager
+
     ui = CLIInterface()
     file_mgr = FileManager()
     
@@ -357,14 +503,18 @@ def verify_config():
     #else:
     #    ui.print_error("✗ Anthropic API key not found")
     
-    # Check paths
-    paths_ok = True
-    for name, path in [
+    # Check paths (stat'd concurrently, so one slow mount doesn't hold up the rest)
+    checks = [
         ("Big paintings", PAINTINGS_BIG_PATH),
         ("Instagram paintings", PAINTINGS_INSTAGRAM_PATH),
     #    ("Metadata output", METADATA_OUTPUT_PATH),
-    ]:
-        if path.exists():
+    ]
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        exists = list(pool.map(Path.exists, [path for _, path in checks]))
+    
+    paths_ok = True
+    for (name, path), path_exists in zip(checks, exists):
+        if path_exists:
             ui.print_success(f"✓ {name}: {path}")
         else:
             ui.print_error(f"✗ {name} not found: {path}")
@@ -410,35 +560,7 @@ def test_faso_login():
         ui.print_success("\n✓ FASO login test successful!")
     else:
         ui.print_error("\n✗ FASO login test failed")
-        ui.print_info("Check debug screenshots: debug_*.png")
-
-
-@cli.command()
-def verify_config_old():
-    """Verify configuration and paths."""
-    ui = CLIInterface()
-    
-    ui.print_header("Configuration Verification")
-    
-    # Check paths
-    checks = [
-        ("Big paintings path", PAINTINGS_BIG_PATH),
-        ("Instagram paintings path", PAINTINGS_INSTAGRAM_PATH),
-    ]
-    
-    for name, path in checks:
-        if path.exists():
-            ui.print_success(f"{name}: {path}")
-        else:
-            ui.print_error(f"{name} not found: {path}")
-    
-    # Check API key
-    from config.settings import ANTHROPIC_API_KEY
-    if ANTHROPIC_API_KEY and ANTHROPIC_API_KEY != "your_api_key_here":
-        ui.print_success("Anthropic API key: configured")
-    else:
-        ui.print_error("Anthropic API key: NOT configured")
-        ui.print_info("Set ANTHROPIC_API_KEY in your .env file")
+        ui.print_info(f"Check debug screenshots: {SCREENSHOTS_DIR / 'debug_*.jpg'}")
 
 
 @cli.command()
@@ -513,6 +635,11 @@ def schedule_post():
         _log.exception("schedule-post command failed")
 
 
+def _print_cron_error(message: str) -> None:
+    """Report an error from a cron-driven command: red on a terminal, plain text in cron mail."""
+    click.secho(message, fg="red", err=True)
+
+
 @cli.command()
 def check_schedule():
     """Execute pending scheduled posts (designed for cron job)."""
@@ -523,7 +650,7 @@ def check_schedule():
     try:
         check_schedule_cli()
     except Exception as e:
-        console.print(f"[red]Schedule check error: {e}[/red]")
+        _print_cron_error(f"Schedule check error: {e}")
         _log.exception("check-schedule command failed")
 
 
@@ -543,19 +670,17 @@ def daily_post():
     from src.app.services.activity_log import log_activity
     from config.settings import METADATA_OUTPUT_PATH
 
-    ui = CLIInterface()
     log_activity("CLI: daily-post")
 
     try:
         success = run_daily_post(METADATA_OUTPUT_PATH)
         if not success:
-            ui.print_error("Daily post failed")
-            import sys
+            _print_cron_error("Daily post failed")
             sys.exit(1)
     except KeyboardInterrupt:
-        ui.print_warning("\nDaily posting interrupted by user")
+        click.echo("\nDaily posting interrupted by user", err=True)
     except Exception as e:
-        ui.print_error(f"Error: {e}")
+        _print_cron_error(f"Error: {e}")
         _log.exception("daily-post command failed")
         sys.exit(1)
 
@@ -7,7 +7,7 @@ import asyncio
 from pathlib import Path
 from urllib.parse import urlparse
 
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 from rich.console import Console
 
 from config.settings import COOKIES_DIR
@@ -17,6 +17,29 @@ console = Console()
 # Persistent browser profile directory
 BROWSER_PROFILE_DIR = COOKIES_DIR / "faso_browser_profile"
 
+# FASO's admin backend; the dashboard is served from here once logged in
+DASHBOARD_HOST = 'data.fineartstudioonline.com'
+
+# The "Works" menu link only exists on the logged-in dashboard
+DASHBOARD_SELECTOR = 'a:has-text("Works")'
+
+# Either the dashboard's "Works" menu link or the login form's password field;
+# whichever appears first tells us the page has settled on one or the other
+PAGE_READY_SELECTOR = f'{DASHBOARD_SELECTOR}, input[name="Password"]'
+
+
+async def wait_for_dashboard_or_login(page) -> None:
+    """Wait until the dashboard menu or the login form is rendered."""
+    try:
+        await page.wait_for_selector(PAGE_READY_SELECTOR, timeout=10_000)
+    except PlaywrightTimeoutError:
+        pass  # Neither appeared; the caller still judges by the URL
+
+
+def is_dashboard_url(url: str) -> bool:
+    """True for a FASO admin backend page other than the login form."""
+    return urlparse(url).hostname == DASHBOARD_HOST and '/login' not in url.lower()
+
 
 async def manual_login_and_save():
     """
@@ -56,7 +79,7 @@ async def manual_login_and_save():
         # Go to FASO login page directly
         console.print("[cyan]Opening FASO login...[/cyan]")
         await page.goto('https://data.fineartstudioonline.com/login/')
-        await page.wait_for_load_state('networkidle')
+        await wait_for_dashboard_or_login(page)
 
         current_url = page.url
         console.print(f"[cyan]Current URL: {current_url}[/cyan]")
@@ -65,26 +88,20 @@ async def manual_login_and_save():
             console.print("\n[bold green]═══ NOW IT'S YOUR TURN! ═══[/bold green]")
             console.print("[green]1. Login manually in the browser[/green]")
             console.print("[green]2. Solve any CAPTCHA that appears[/green]")
-            console.print("[green]3. Wait until you see your dashboard/home page[/green]")
-            console.print("[green]4. Come back here and press Enter[/green]\n")
+            console.print("[green]3. This script continues by itself once you are past the login page[/green]\n")
+
+            # Proceed once the admin backend is showing its dashboard menu;
+            # CAPTCHA or SSO pages on other hosts/paths do not count
+            await page.wait_for_url(is_dashboard_url, timeout=0)
+            await page.wait_for_selector(DASHBOARD_SELECTOR, timeout=0)
         else:
             console.print("[green]Already logged in from previous session![/green]")
 
-        input("Press Enter when you're done (session saves automatically)...")
-
-        console.print(f"[cyan]Final URL: {page.url}[/cyan]")
-
-        # Verify session by navigating to the admin dashboard
-        console.print("\n[cyan]Verifying session - navigating to dashboard...[/cyan]")
-        await page.goto('https://data.fineartstudioonline.com/')
-        await page.wait_for_load_state('networkidle')
-        await asyncio.sleep(2)
-
         final_url = page.url
         console.print(f"[cyan]Dashboard URL: {final_url}[/cyan]")
 
         # Check if we're on the admin backend (not redirected to public site)
-        if urlparse(final_url).hostname == 'data.fineartstudioonline.com' and '/login' not in final_url.lower():
+        if is_dashboard_url(final_url):
             console.print("[bold green]Session verified! Dashboard accessible.[/bold green]")
             marker = BROWSER_PROFILE_DIR / ".logged_in"
             marker.write_text("ok")
@@ -94,8 +111,7 @@ async def manual_login_and_save():
             console.print("[yellow]2. After seeing the dashboard, press Enter here[/yellow]")
             input("Press Enter to retry verification...")
             await page.goto('https://data.fineartstudioonline.com/')
-            await page.wait_for_load_state('networkidle')
-            await asyncio.sleep(2)
+            await wait_for_dashboard_or_login(page)
             final_url = page.url
             console.print(f"[cyan]Retry URL: {final_url}[/cyan]")
             marker = BROWSER_PROFILE_DIR / ".logged_in"
@@ -10,6 +10,7 @@ Run from the project root:
     python testing-scripts/cleanup_test_paintings.py
 """
 
+import shutil
 import sys
 from pathlib import Path
 
@@ -19,44 +20,33 @@ from config.settings import PAINTINGS_BIG_PATH, METADATA_OUTPUT_PATH
 
 CATEGORY = "test-paintings"
 
-TEST_FILENAMES = [
-    "test_painting_1",
-    "test_painting_2",
-    "test_painting_3",
-]
 
-
-def remove_file(path: Path) -> None:
-    if path.exists():
-        path.unlink()
-        print(f"  removed : {path}")
-    else:
-        print(f"  missing : {path}")
-
-
-def remove_dir_if_empty(path: Path) -> None:
-    if path.exists() and not any(path.iterdir()):
-        path.rmdir()
-        print(f"  removed dir : {path}")
+def remove_dir(path: Path) -> str:
+    """Delete a test-paintings folder and everything in it; return the status line."""
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        return f"  missing : {path}"
+    return f"  removed dir : {path}"
 
 
 def main() -> None:
     images_dir = PAINTINGS_BIG_PATH / CATEGORY
     metadata_dir = METADATA_OUTPUT_PATH / CATEGORY
 
-    print(f"\nCleaning up test paintings...\n")
-
-    for name in TEST_FILENAMES:
-        print(f"  [{name}]")
-        remove_file(images_dir / f"{name}.jpg")
-        remove_file(metadata_dir / f"{name}.json")
-        remove_file(metadata_dir / f"{name}.txt")
-
-    # Remove directories if now empty
-    remove_dir_if_empty(images_dir)
-    remove_dir_if_empty(metadata_dir)
-
-    print(f"\nDone.\n")
+    # Both folders hold only what generate_test_paintings.py created, so
+    # remove them whole rather than file by file
+    lines = [
+        "",
+        "Cleaning up test paintings...",
+        "",
+        remove_dir(images_dir),
+        remove_dir(metadata_dir),
+        "",
+        "Done.",
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -23,7 +23,7 @@ from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 
 from config.settings import PAINTINGS_BIG_PATH, METADATA_OUTPUT_PATH
-from src.app.services.metadata_manager import MetadataManager
+from src.app.services.metadata_manager import MetadataManager, PaintingDetails
 
 # ── Configuration ─────────────────────────────────────────────────────────────
 
@@ -128,18 +128,20 @@ def main() -> None:
             selected_title=p["title"],
             all_titles=[p["title"], f"Alternate Title for {p['title']}"],
             description=p["description"],
-            width=p["width"],
-            height=p["height"],
-            depth=None,
-            dimension_unit=unit,
-            dimensions_formatted=f"{p['width']:.0f}{unit} x {p['height']:.0f}{unit}",
-            substrate=p["substrate"],
-            medium=p["medium"],
-            subject=p["subject"],
-            style=p["style"],
-            collection=p["collection"],
-            price_eur=p["price_eur"],
-            creation_date=datetime.now().strftime("%Y-%m-%d"),
+            details=PaintingDetails(
+                width=p["width"],
+                height=p["height"],
+                depth=None,
+                dimension_unit=unit,
+                dimensions_formatted=f"{p['width']:.0f}{unit} x {p['height']:.0f}{unit}",
+                substrate=p["substrate"],
+                medium=p["medium"],
+                subject=p["subject"],
+                style=p["style"],
+                collection=p["collection"],
+                price_eur=p["price_eur"],
+                creation_date=datetime.now().strftime("%Y-%m-%d"),
+            ),
             analyzed_from="big",
         )
 
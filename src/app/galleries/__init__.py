@@ -3,12 +3,15 @@ Art gallery website platform registry.
 Maps gallery names to their implementation classes.
 """
 
+from typing import Dict, Type
+
 from src.app.galleries.base import GalleryPlatform
+from src.app.galleries.faso import FASOGallery
 
 
-# Gallery registry: name -> module path + class name
-_GALLERY_REGISTRY = {
-    "faso": ("src.app.galleries.faso", "FASOGallery"),
+# Gallery registry: name -> class
+_GALLERY_REGISTRY: Dict[str, Type[GalleryPlatform]] = {
+    "faso": FASOGallery,
 }
 
 
@@ -28,11 +31,7 @@ def get_gallery(name: str) -> GalleryPlatform:
     if name not in _GALLERY_REGISTRY:
         raise KeyError(f"Unknown gallery platform: {name}")
 
-    module_path, class_name = _GALLERY_REGISTRY[name]
-    import importlib
-    module = importlib.import_module(module_path)
-    cls = getattr(module, class_name)
-    return cls()
+    return _GALLERY_REGISTRY[name]()
 
 
 def get_all_gallery_names() -> list:
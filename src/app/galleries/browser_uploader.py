@@ -5,22 +5,61 @@ Each gallery site subclass only needs to implement its own navigation
 and form-filling logic.
 """
 
-import asyncio
 import json
 import re
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
 
 from playwright.async_api import async_playwright, Page, BrowserContext
 from rich.console import Console
 
+from config.settings import SCREENSHOTS_DIR
 from src.core.logger import get_logger
 
 console = Console()
 
+# Chromium flags: hide the automation marker, use /tmp instead of the small
+# /dev/shm, and skip background traffic and extensions an upload never needs
+_CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-extensions",
+]
+
+# Read the option labels of several <select> elements in one round-trip
+_SELECT_OPTIONS_JS = """
+(names) => Object.fromEntries(names.map(name => {
+    const el = document.querySelector(`select[name="${name}"]`);
+    return [name, el ? Array.from(el.options, o => o.textContent.trim()) : []];
+}))
+"""
+
+# Set inputs by value and selects by option label, firing the events a user
+# edit would; returns the names that could not be set
+_FILL_FORM_JS = """
+(values) => {
+    const missing = [];
+    for (const [name, value] of Object.entries(values)) {
+        const el = document.querySelector(`[name="${name}"]`);
+        if (!el) { missing.push(name); continue; }
+        if (el.tagName === 'SELECT') {
+            const option = Array.from(el.options).find(o => o.textContent.trim() === value);
+            if (!option) { missing.push(name); continue; }
+            option.selected = true;
+        } else {
+            el.value = value;
+        }
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+    return missing;
+}
+"""
+
 
 class BaseBrowserUploader(ABC):
     """
@@ -39,6 +78,9 @@ class BaseBrowserUploader(ABC):
         self.playwright = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        # Dropdown option labels by <select> name; the lists are site-wide,
+        # so one fetch serves every painting uploaded this session
+        self._option_cache: Dict[str, List[str]] = {}
         self._logger = get_logger(self.name or "gallery")
 
     # -------------------------------------------------------------------------
@@ -79,7 +121,7 @@ class BaseBrowserUploader(ABC):
             user_data_dir=str(self.profile_dir),
             headless=self.headless,
             viewport={"width": 1920, "height": 1080},
-            args=["--disable-blink-features=AutomationControlled"],
+            args=_CHROMIUM_ARGS,
         )
         await self.context.add_init_script(
             "Object.defineProperty(navigator, 'webdriver', { get: () => undefined });"
@@ -90,7 +132,6 @@ class BaseBrowserUploader(ABC):
 
         await self.page.goto(self.dashboard_url)
         await self.page.wait_for_load_state("networkidle")
-        await asyncio.sleep(2)
 
         current = self.page.url
         expected_host = urlparse(self.dashboard_url).hostname
@@ -125,49 +166,50 @@ class BaseBrowserUploader(ABC):
     # Shared form helpers
     # -------------------------------------------------------------------------
 
-    async def _fill_text_field(self, selector: str, value: str):
-        """Clear a text input and type a new value."""
-        try:
-            field = await self.page.wait_for_selector(selector, timeout=3000)
-            await field.click(click_count=3)
-            await field.fill(value)
-        except Exception as e:
-            console.print(f"[yellow]Warning: could not fill {selector}: {e}[/yellow]")
-
-    async def _select_dropdown(self, selector: str, value: str):
-        """Select a dropdown option by exact visible label."""
-        try:
-            await self.page.select_option(selector, label=value)
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: could not select '{value}' in {selector}: {e}[/yellow]"
+    async def _select_options(self, page: Page, names: List[str]) -> Dict[str, List[str]]:
+        """Return the option labels of each named <select>, fetching uncached ones in one call."""
+        missing = [name for name in names if name not in self._option_cache]
+        if missing:
+            fetched = await page.evaluate(_SELECT_OPTIONS_JS, missing)
+            # A missing <select> comes back empty; leave it to be fetched again
+            self._option_cache.update(
+                (name, options) for name, options in fetched.items() if options
             )
+            return {name: self._option_cache.get(name) or fetched[name] for name in names}
+        return {name: self._option_cache[name] for name in names}
 
-    async def _select_dropdown_fuzzy(self, selector: str, value: str):
-        """Select a dropdown option using normalised fuzzy label matching."""
-        try:
-            await self.page.select_option(selector, label=value)
-            return
-        except Exception:
-            pass
+    def _match_option(self, options: List[str], value: str) -> Optional[str]:
+        """
+        Pick the dropdown label for a value: an exact match, else a normalised one.
 
-        try:
-            options = await self.page.eval_on_selector_all(
-                f"{selector} option",
-                "els => els.map(e => e.textContent.trim())",
-            )
-            normalized = self._normalize_for_match(value)
-            for option in options:
-                if option and self._normalize_for_match(option) == normalized:
-                    await self.page.select_option(selector, label=option)
-                    console.print(f"[green]Matched '{value}' → '{option}'[/green]")
-                    return
-            console.print(
-                f"[yellow]Warning: no fuzzy match for '{value}' in {selector}[/yellow]"
-            )
-        except Exception as e:
+        Args:
+            options: Option labels of the dropdown
+            value: Value to select
+
+        Returns:
+            The matching label, or None if nothing matches
+        """
+        if value in options:
+            return value
+        normalized = self._normalize_for_match(value)
+        for option in options:
+            if option and self._normalize_for_match(option) == normalized:
+                console.print(f"[green]Matched '{value}' → '{option}'[/green]")
+                return option
+        return None
+
+    async def _fill_form(self, page: Page, values: Dict[str, str]):
+        """
+        Set several form fields by name in a single page.evaluate.
+
+        Args:
+            page: Page holding the form
+            values: Field name → value for inputs, or option label for selects
+        """
+        missing = await page.evaluate(_FILL_FORM_JS, values)
+        for name in missing:
             console.print(
-                f"[yellow]Warning: fuzzy select failed for '{value}': {e}[/yellow]"
+                f"[yellow]Warning: could not set {name} to '{values[name]}'[/yellow]"
             )
 
     @staticmethod
@@ -175,14 +217,14 @@ class BaseBrowserUploader(ABC):
         """Normalise text for fuzzy dropdown matching (lowercase, strip punctuation)."""
         return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
 
-    async def _fill_description(self, description: str):
+    async def _fill_description(self, page: Page, description: str):
         """
         Fill a rich text description editor.
         Tries TinyMCE JS API first, then textarea fallback, then iframe body.
         """
         html_content = self.markdown_to_html(description)
         try:
-            result = await self.page.evaluate(f"""
+            result = await page.evaluate(f"""
                 () => {{
                     if (typeof tinymce !== 'undefined' && tinymce.get("Description")) {{
                         tinymce.get("Description").setContent({json.dumps(html_content)});
@@ -195,13 +237,13 @@ class BaseBrowserUploader(ABC):
                 console.print("[green]Description filled via TinyMCE API[/green]")
                 return
 
-            textarea = await self.page.query_selector('textarea[name="Description"]')
+            textarea = await page.query_selector('textarea[name="Description"]')
             if textarea:
                 await textarea.fill(html_content)
                 console.print("[green]Description filled via textarea[/green]")
                 return
 
-            iframe = await self.page.query_selector("iframe#Description_ifr")
+            iframe = await page.query_selector("iframe#Description_ifr")
             if iframe:
                 frame = await iframe.content_frame()
                 if frame:
@@ -215,13 +257,12 @@ class BaseBrowserUploader(ABC):
         except Exception as e:
             console.print(f"[yellow]Warning: description fill failed: {e}[/yellow]")
 
-    async def _take_error_screenshot(self, step: str):
+    async def _take_error_screenshot(self, page: Page, step: str):
         """Save a debug screenshot to the configured screenshots directory."""
-        from config.settings import SCREENSHOTS_DIR
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         path = SCREENSHOTS_DIR / f"{self.name}_error_{step}_{timestamp}.png"
         try:
-            await self.page.screenshot(path=str(path), full_page=True)
+            await page.screenshot(path=str(path), full_page=True)
             console.print(f"[yellow]Error screenshot: {path}[/yellow]")
         except Exception:
             pass
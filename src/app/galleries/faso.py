@@ -3,11 +3,19 @@ FASO gallery platform wrapper.
 Wraps the existing faso_uploader.py to fit the GalleryPlatform interface.
 """
 
+from functools import cache
 from typing import Dict, Any
 
 from src.app.galleries.base import GalleryPlatform, UploadResult
 
 
+@cache
+def _faso_is_configured() -> bool:
+    """Check once per process whether FASO credentials are configured."""
+    from config.settings import FASO_EMAIL, FASO_PASSWORD
+    return bool(FASO_EMAIL and FASO_EMAIL != "xxx" and FASO_PASSWORD and FASO_PASSWORD != "xxx")
+
+
 class FASOGallery(GalleryPlatform):
     """FASO (Fine Art Studio Online) gallery integration."""
 
@@ -27,5 +35,4 @@ class FASOGallery(GalleryPlatform):
 
     def is_configured(self) -> bool:
         """Check if FASO credentials are configured."""
-        from config.settings import FASO_EMAIL, FASO_PASSWORD
-        return bool(FASO_EMAIL and FASO_EMAIL != "xxx" and FASO_PASSWORD and FASO_PASSWORD != "xxx")
+        return _faso_is_configured()
@@ -4,20 +4,179 @@ Handles authentication and navigation using Playwright.
 """
 
 import asyncio
+import math
+import os
+import random
 import time
 from pathlib import Path
+from textwrap import dedent
 from typing import Optional, Dict, Any
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+import orjson
+from playwright.async_api import (
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Locator,
+    Page,
+)
 from rich.console import Console
 
+from config.settings import FASO_COOKIES_PATH, FASO_SESSION_TTL_SECONDS, SCREENSHOTS_DIR
+from src.core.logger import get_logger
+
 console = Console()
+logger = get_logger("faso")
+
+# Clicks the first visible element whose tag and text match one of the
+# (tag, text) targets, checking them in order; text matching follows
+# Playwright's :has-text (case-insensitive substring, whitespace collapsed)
+_CLICK_FIRST_JS = dedent("""
+    (targets) => {
+        for (const [tag, text] of targets) {
+            const wanted = text.toLowerCase();
+            for (const el of document.querySelectorAll(tag)) {
+                const label = el.textContent.replace(/\\s+/g, ' ').toLowerCase();
+                if (label.includes(wanted) && el.getClientRects().length) {
+                    el.click();
+                    return true;
+                }
+            }
+        }
+        return false;
+    }
+""").strip()
+
+# Screenshots saved when navigating to the Add Artwork form fails
+_DEBUG_AFTER_LOGIN_JPG = SCREENSHOTS_DIR / "debug_after_login.jpg"
+_DEBUG_WORKS_PAGE_JPG = SCREENSHOTS_DIR / "debug_works_page.jpg"
+_DEBUG_ERROR_JPG = SCREENSHOTS_DIR / "debug_error.jpg"
+
+# Runs in every page before FASO's own scripts, masking the signs of
+# browser automation that bot checks look for
+_STEALTH_JS = dedent("""
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Hide Playwright
+    delete window.playwright;
+
+    // Make chrome object look real
+    window.chrome = {
+        runtime: {},
+        loadTimes: () => ({}),
+        csi: () => ({}),
+    };
+
+    // Fake plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+
+    // Fake languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+
+    // Report a typical desktop CPU count
+    Object.defineProperty(navigator, 'hardwareConcurrency', {
+        get: () => 8
+    });
+
+    // Answer notification permission queries like a normal browser
+    const originalQuery = navigator.permissions.query.bind(navigator.permissions);
+    navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications'
+            ? Promise.resolve({ state: 'prompt' })
+            : originalQuery(parameters)
+    );
+
+    // Report a common GPU instead of the software renderer
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function (parameter) {
+        if (parameter === 37445) return 'Intel Inc.';  // UNMASKED_VENDOR_WEBGL
+        if (parameter === 37446) return 'Intel Iris OpenGL Engine';  // UNMASKED_RENDERER_WEBGL
+        return getParameter.call(this, parameter);
+    };
+""").strip()
+
+# Resources the FASO admin pages work without; skipping them speeds up loads
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "doubleclick", "facebook.net")
+
+
+def _typing_delay() -> int:
+    """
+    Draw a per-keystroke delay in ms for typing one form field.
+    
+    Human typing speed is roughly log-normal around ~120 ms per key; clipping
+    keeps rare draws from being implausibly fast or slow.
+    """
+    return int(min(max(random.lognormvariate(math.log(120), 0.35), 60), 400))
+
+
+async def _block_assets(route):
+    """Abort requests for page assets and trackers; let everything else through."""
+    request = route.request
+    # The CAPTCHA widget has to render fully for a human to solve it
+    if "challenges.cloudflare.com" not in request.url and (
+        request.resource_type in _BLOCKED_RESOURCE_TYPES
+        or any(host in request.url for host in _BLOCKED_HOSTS)
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Candidate selectors for the elements the flow clicks, joined into CSS
+# selector lists so each set is waited on in one go
+_SUBMIT_SELECTORS = (
+    'button[type="submit"]',
+    'input[type="submit"]',
+    'button:has-text("Log in")',
+    'button:has-text("Sign in")',
+    'button:has-text("Login")',
+)
+_SUBMIT_SELECTOR = ", ".join(_SUBMIT_SELECTORS)
+_WORKS_SELECTORS = ('a:has-text("Works")', 'button:has-text("Works")')
+_WORKS_SELECTOR = ", ".join(_WORKS_SELECTORS)
+_WORKS_TARGETS = (("a", "Works"), ("button", "Works"))
+_ADD_ARTWORK_SELECTORS = (
+    'a:has-text("Add New Artwork")',
+    'button:has-text("Add New Artwork")',
+    'a:has-text("Add Artwork")',
+)
+_ADD_ARTWORK_SELECTOR = ", ".join(_ADD_ARTWORK_SELECTORS)
+# Any "add" link is only a last resort; racing it against the labelled
+# links could pick an unrelated link earlier on the page
+_ADD_ARTWORK_FALLBACK_SELECTOR = '[href*="add"]'
+
+# Seconds to wait for the browser to shut down before stopping it forcibly
+_CLOSE_TIMEOUT = 5
+
+_DASHBOARD_URL = 'https://data.fineartstudioonline.com/cfgeditwebsite.asp?new_login=y&faso_com_auth=y'
+
+# The dashboard's "Works" menu link shows the user is logged in
+_DASHBOARD_MARKER = 'a:has-text("Works")'
+# The message FASO shows inside the login form on a failed login; only a
+# visible one counts, so empty placeholders don't end the wait early
+_LOGIN_ERROR = 'form:has(input[type="password"]) :is(.alert-danger, .error):visible'
 
 
 class FASOClient:
     """Client for interacting with FASO website."""
     
-    def __init__(self, email: str, password: str, headless: bool = False, cookies_file: Path = None):
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        headless: bool = False,
+        cookies_file: Path = None,
+        block_assets: bool = True,
+    ):
         """
         Initialize FASO client.
         
@@ -27,31 +186,33 @@ class FASOClient:
             headless: Run browser in headless mode (default: False for debugging)
             cookies_file: Path to save/load cookies for session persistence
                          If None, uses FASO_COOKIES_PATH from settings
+            block_assets: Skip loading images, fonts, media and analytics
+                          (turn off for flows that need to see images)
         """
         if cookies_file is None:
-            from config.settings import FASO_COOKIES_PATH
             cookies_file = FASO_COOKIES_PATH
             
         self.email = email
         self.password = password
         self.headless = headless
         self.cookies_file = cookies_file
+        self.block_assets = block_assets
         
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.playwright = None
+        self._logged_in = False
     
     async def start(self):
         """Start the browser and create a new page."""
-        console.print("[cyan]Starting browser...[/cyan]")
+        logger.debug("Starting browser...")
         
         self.playwright = await async_playwright().start()
-        
-        # Launch browser (chromium by default)
+        # No slow_mo: it delays every action, page reads included, and is
+        # only useful for watching a run while debugging
         self.browser = await self.playwright.chromium.launch(
             headless=self.headless,
-            slow_mo=100,  # Slow down by 100ms to appear more human-like
             args=[
                 '--disable-blink-features=AutomationControlled',  # Hide automation
                 '--disable-dev-shm-usage',
@@ -61,8 +222,10 @@ class FASOClient:
             ]
         )
         
-        # Create browser context with anti-detection settings
+        # Create browser context with anti-detection settings, restoring the
+        # saved session (skip login if already authenticated)
         self.context = await self.browser.new_context(
+            storage_state=self._load_session(),
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             locale='en-US',
@@ -74,44 +237,90 @@ class FASOClient:
             }
         )
         
-        # Add script to hide webdriver property (Cloudflare checks this)
-        await self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // Hide Playwright
-            delete window.playwright;
-            
-            // Make chrome object look real
-            window.chrome = {
-                runtime: {}
-            };
-            
-            // Fake plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            
-            // Fake languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-        """)
+        # Hide automation markers (Cloudflare checks these)
+        await self.context.add_init_script(_STEALTH_JS)
         
-        # Load cookies if they exist (skip login if already authenticated)
-        if self.cookies_file.exists():
-            console.print("[cyan]Loading saved session cookies...[/cyan]")
-            import json
-            with open(self.cookies_file, 'r') as f:
-                cookies = json.load(f)
-            await self.context.add_cookies(cookies)
-            console.print("[green]✓ Cookies loaded[/green]")
+        if self.block_assets:
+            await self.context.route("**/*", _block_assets)
         
         # Create new page
         self.page = await self.context.new_page()
         
-        console.print("[green]✓ Browser started[/green]")
+        logger.debug("Browser started")
+    
+    def _load_session(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the saved browser session, if there is one.
+        
+        Older versions saved a bare cookie list; it is wrapped into the
+        storage state layout Playwright expects.
+        
+        Returns:
+            Storage state dict, or None if no session has been saved
+        """
+        if not self.cookies_file.exists():
+            return None
+        
+        logger.debug("Loading saved session...")
+        state = orjson.loads(self.cookies_file.read_bytes())
+        if isinstance(state, list):
+            state = {"cookies": state, "origins": []}
+        return state
+    
+    async def _wait_for_any(self, selector: str, timeout: float = 5000) -> Optional[Locator]:
+        """
+        Wait for the first visible element matching a selector list.
+        
+        Given a comma-separated CSS selector list, Playwright looks for all
+        of the candidates at once under a single timeout.
+        
+        Args:
+            selector: Selector, or comma-separated list of candidates
+            timeout: Milliseconds to wait before giving up
+            
+        Returns:
+            Locator for the matching element, or None if none appeared
+        """
+        locator = self.page.locator(selector).first
+        try:
+            await locator.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+        return locator
+    
+    async def _click_first_present(self, targets) -> bool:
+        """
+        Click an element that is already on the page, in one browser round trip.
+        
+        Args:
+            targets: (tag, text) pairs tried in order
+            
+        Returns:
+            True if an element was clicked, False if none is there yet
+        """
+        return await self.page.evaluate(_CLICK_FIRST_JS, targets)
+    
+    async def _wait_for_login_result(self, timeout: float):
+        """
+        Wait until the browser leaves the login page or a login error shows.
+        
+        Args:
+            timeout: Milliseconds to wait before giving up
+        """
+        left_login = asyncio.create_task(
+            self.page.wait_for_url(lambda url: 'login' not in url.lower(), timeout=timeout)
+        )
+        error_shown = asyncio.create_task(
+            self.page.locator(_LOGIN_ERROR).first.wait_for(timeout=timeout)
+        )
+        done, pending = await asyncio.wait(
+            {left_login, error_shown}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        # Collect outcomes (timeouts, cancellations) so none go unretrieved;
+        # the caller judges the result by the URL
+        await asyncio.gather(*done, *pending, return_exceptions=True)
     
     async def is_logged_in(self) -> bool:
         """
@@ -125,11 +334,7 @@ class FASOClient:
         
         try:
             # Navigate directly to the user dashboard (requires login)
-            await self.page.goto(
-                'https://data.fineartstudioonline.com/cfgeditwebsite.asp?new_login=y&faso_com_auth=y',
-                timeout=10000,
-            )
-            await self.page.wait_for_load_state('networkidle', timeout=5000)
+            await self.page.goto(_DASHBOARD_URL, timeout=10000)
 
             # If redirected to login page, session has expired
             if 'login' in self.page.url.lower():
@@ -137,9 +342,26 @@ class FASOClient:
 
             return True
 
-        except:
+        except PlaywrightError:
+            # Navigation failed or timed out; treat the session as unusable
             return False
     
+    async def _goto_dashboard(self):
+        """Open the user dashboard and wait for its menu."""
+        await self.page.goto(_DASHBOARD_URL, timeout=10000)
+        try:
+            await self.page.locator(_DASHBOARD_MARKER).first.wait_for(timeout=10000)
+        except PlaywrightTimeoutError:
+            pass  # Still logged in; navigate_to_add_artwork reports a missing menu
+    
+    async def _save_session(self):
+        """Save cookies and local storage for future sessions."""
+        state = await self.context.storage_state()
+        self.cookies_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cookies_file.with_name(self.cookies_file.name + ".tmp")
+        tmp_file.write_bytes(orjson.dumps(state))
+        os.replace(tmp_file, self.cookies_file)
+    
     async def login(self) -> bool:
         """
         Log into FASO website.
@@ -152,85 +374,61 @@ class FASOClient:
             console.print("[red]Error: Browser not started. Call start() first.[/red]")
             return False
         
-        # Check if we're already logged in (from saved cookies)
+        if self._logged_in:
+            return True
+        
+        # Check if we're already logged in (from saved cookies); a session
+        # past its lifetime would only fail the check, so skip that page load
         if self.cookies_file.exists():
-            console.print("[cyan]Checking if saved session is still valid...[/cyan]")
-            if await self.is_logged_in():
-                console.print("[green]✓ Already logged in using saved session![/green]")
-                return True
+            session_age = time.time() - self.cookies_file.stat().st_mtime
+            if session_age >= FASO_SESSION_TTL_SECONDS:
+                console.print("[yellow]Saved session is too old, logging in again...[/yellow]")
             else:
-                console.print("[yellow]Saved session expired, logging in again...[/yellow]")
+                logger.debug("Checking if saved session is still valid...")
+                if await self.is_logged_in():
+                    console.print("[green]✓ Already logged in using saved session![/green]")
+                    self._logged_in = True
+                    return True
+                else:
+                    console.print("[yellow]Saved session expired, logging in again...[/yellow]")
         
         try:
-            console.print("[cyan]Navigating to FASO login page...[/cyan]")
+            logger.debug("Navigating to FASO login page...")
             
             # Navigate to login page
             await self.page.goto('https://data.fineartstudioonline.com/login/')
             
-            # Wait for page to load
-            await self.page.wait_for_load_state('networkidle')
-            
-            # Add human-like delay before interacting
-            await asyncio.sleep(2)
-            
-            console.print("[cyan]Entering credentials (typing slowly)...[/cyan]")
+            logger.debug("Entering credentials...")
             
             # Type email slowly (human-like)
             # FASO uses name="Email" for the email field
             email_field = await self.page.wait_for_selector('input[name="Email"]')
             
-            # Move mouse to field first (human-like)
-            await email_field.hover()
-            await asyncio.sleep(0.3)
-            
             await email_field.click()
-            await asyncio.sleep(0.5)
             
-            # Type with random delays between 150-250ms
-            for char in self.email:
-                await email_field.type(char, delay=150 + (hash(char) % 100))
-                
-            # Small pause between fields
-            await asyncio.sleep(1)
+            # One call; Playwright spaces the keystrokes out in the driver
+            await email_field.type(self.email, delay=_typing_delay())
+            
+            # Small pause between fields; the form fields are the only place
+            # the flow is paced like a human
+            await asyncio.sleep(0.4)
             
             # Type password slowly
             # FASO uses name="Password" for the password field
             password_field = await self.page.wait_for_selector('input[name="Password"]')
             
-            # Move mouse to password field
-            await password_field.hover()
-            await asyncio.sleep(0.3)
-            
             await password_field.click()
-            await asyncio.sleep(0.5)
             
-            # Type password with random delays
-            for char in self.password:
-                await password_field.type(char, delay=150 + (hash(char) % 100))
+            await password_field.type(self.password, delay=_typing_delay())
             
             # Small pause before submitting
-            await asyncio.sleep(1)
+            await asyncio.sleep(0.4)
             
-            console.print("[cyan]Submitting login...[/cyan]")
+            logger.debug("Submitting login...")
             
             # Find and click submit button
-            # Try multiple common selectors
-            submit_button = None
-            selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button:has-text("Log in")',
-                'button:has-text("Sign in")',
-                'button:has-text("Login")',
-            ]
-            
-            for selector in selectors:
-                try:
-                    submit_button = await self.page.wait_for_selector(selector, timeout=2000)
-                    if submit_button:
-                        break
-                except:
-                    continue
+            # Any of the common submit-button selectors will do
+            submit_button = await self._wait_for_any(_SUBMIT_SELECTOR)
             
             if not submit_button:
                 console.print("[red]Error: Could not find submit button[/red]")
@@ -245,15 +443,13 @@ class FASOClient:
             console.print("[yellow]  1. Click the checkbox[/yellow]")
             console.print("[yellow]  2. Wait for it to verify (checkmark appears)[/yellow]")
             console.print("[yellow]  3. Click it AGAIN if it asks you to[/yellow]")
-            console.print("[cyan]Waiting 15 seconds for you to complete verification...[/cyan]\n")
+            console.print("[cyan]Waiting up to 2 minutes for login to complete...[/cyan]\n")
             
-            await asyncio.sleep(15)  # Long pause for manual CAPTCHA solving
+            # Continues as soon as FASO either leaves the login page or shows
+            # an error, so runs without a CAPTCHA don't wait at all
+            await self._wait_for_login_result(timeout=120_000)
             
-            console.print("[green]Continuing...[/green]")
-            
-            # Wait for navigation after login
-            console.print("[cyan]Waiting for login to complete...[/cyan]")
-            await self.page.wait_for_load_state('networkidle', timeout=10000)
+            logger.debug("Continuing...")
             
             # Check if login was successful
             # Look for signs of successful login (dashboard, menu, etc.)
@@ -265,32 +461,24 @@ class FASOClient:
                 
                 # Check for error message
                 try:
-                    error = await self.page.wait_for_selector('.error, .alert-danger, [class*="error"]', timeout=2000)
+                    error = await self.page.wait_for_selector(_LOGIN_ERROR, timeout=2000)
                     if error:
                         error_text = await error.text_content()
                         console.print(f"[red]Error message: {error_text}[/red]")
-                except:
+                except PlaywrightTimeoutError:
                     pass
                 
                 return False
             
             console.print(f"[green]✓ Login successful! Current URL: {current_url}[/green]")
 
-            # Navigate directly to the user dashboard
-            console.print("[cyan]Navigating to user dashboard...[/cyan]")
-            await self.page.goto(
-                'https://data.fineartstudioonline.com/cfgeditwebsite.asp?new_login=y&faso_com_auth=y',
-                timeout=10000,
-            )
-            await self.page.wait_for_load_state('networkidle')
+            # The session is complete as soon as login succeeds, so save it
+            # while the dashboard loads instead of afterwards
+            logger.debug("Navigating to user dashboard...")
+            await asyncio.gather(self._goto_dashboard(), self._save_session())
+            self._logged_in = True
             console.print(f"[green]✓ Dashboard loaded: {self.page.url}[/green]")
-
-            # Save cookies for future sessions
-            cookies = await self.context.cookies()
-            import json
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f)
-            console.print(f"[green]✓ Session cookies saved to {self.cookies_file}[/green]")
+            console.print(f"[green]✓ Session saved to {self.cookies_file}[/green]")
             
             return True
             
@@ -314,126 +502,101 @@ class FASOClient:
             return False
         
         try:
-            console.print("[cyan]Looking for 'Works' in left menu...[/cyan]")
-            
-            # Wait for page to fully load
-            await self.page.wait_for_load_state('networkidle')
-            
-            # Try to find and click "Works" button/link in left menu
-            # Try multiple selectors
-            works_selectors = [
-                'a:has-text("Works")',
-                'button:has-text("Works")',
-                '[class*="menu"] a:has-text("Works")',
-                '[class*="sidebar"] a:has-text("Works")',
-                'nav a:has-text("Works")',
-            ]
+            logger.debug("Looking for 'Works' in left menu...")
             
-            works_button = None
-            for selector in works_selectors:
-                try:
-                    works_button = await self.page.wait_for_selector(selector, timeout=3000)
-                    if works_button:
-                        console.print(f"[green]✓ Found 'Works' button with selector: {selector}[/green]")
-                        break
-                except:
-                    continue
-            
-            if not works_button:
-                console.print("[red]✗ Could not find 'Works' button in menu[/red]")
-                console.print(f"[yellow]Current URL: {self.page.url}[/yellow]")
+            # The dashboard is usually fully rendered by now, so try clicking
+            # "Works" straight away before falling back to waiting for it
+            if await self._click_first_present(_WORKS_TARGETS):
+                logger.debug("Clicked 'Works'")
+            else:
+                # Try to find and click "Works" button/link in left menu
+                works_button = await self._wait_for_any(_WORKS_SELECTOR)
                 
-                # Save screenshot for debugging
-                from config.settings import SCREENSHOTS_DIR
-                screenshot_path = SCREENSHOTS_DIR / "debug_after_login.png"
-                await self.page.screenshot(path=str(screenshot_path))
-                console.print(f"[yellow]Screenshot saved as {screenshot_path}[/yellow]")
+                if works_button:
+                    logger.debug("Found 'Works' button")
+                else:
+                    console.print("[red]✗ Could not find 'Works' button in menu[/red]")
+                    console.print(f"[yellow]Current URL: {self.page.url}[/yellow]")
+                    
+                    await self._save_failure_screenshot(_DEBUG_AFTER_LOGIN_JPG)
+                    
+                    return False
                 
-                return False
-            
-            console.print("[cyan]Clicking 'Works'...[/cyan]")
-            await works_button.click()
-            
-            # Wait for navigation
-            await self.page.wait_for_load_state('networkidle')
+                logger.debug("Clicking 'Works'...")
+                await works_button.click()
             
-            console.print(f"[green]✓ Navigated to Works page: {self.page.url}[/green]")
+            # Now find "Add New Artwork" link; waiting for it also covers
+            # the Works page loading
+            logger.debug("Looking for 'Add New Artwork' link...")
             
-            # Now find "Add New Artwork" link
-            console.print("[cyan]Looking for 'Add New Artwork' link...[/cyan]")
-            
-            add_artwork_selectors = [
-                'a:has-text("Add New Artwork")',
-                'button:has-text("Add New Artwork")',
-                'a:has-text("Add Artwork")',
-                '[href*="add"]',
-            ]
+            add_artwork_link = (
+                await self._wait_for_any(_ADD_ARTWORK_SELECTOR)
+                or await self._wait_for_any(_ADD_ARTWORK_FALLBACK_SELECTOR, timeout=1000)
+            )
             
-            add_artwork_link = None
-            for selector in add_artwork_selectors:
-                try:
-                    add_artwork_link = await self.page.wait_for_selector(selector, timeout=3000)
-                    if add_artwork_link:
-                        console.print(f"[green]✓ Found 'Add New Artwork' link with selector: {selector}[/green]")
-                        break
-                except:
-                    continue
-            
-            if not add_artwork_link:
+            if add_artwork_link:
+                logger.debug("Found 'Add New Artwork' link")
+            else:
                 console.print("[red]✗ Could not find 'Add New Artwork' link[/red]")
                 console.print(f"[yellow]Current URL: {self.page.url}[/yellow]")
                 
-                # Save screenshot for debugging
-                from config.settings import SCREENSHOTS_DIR
-                screenshot_path = SCREENSHOTS_DIR / "debug_works_page.png"
-                await self.page.screenshot(path=str(screenshot_path))
-                console.print(f"[yellow]Screenshot saved as {screenshot_path}[/yellow]")
+                await self._save_failure_screenshot(_DEBUG_WORKS_PAGE_JPG)
                 
                 return False
             
-            console.print("[cyan]Clicking 'Add New Artwork'...[/cyan]")
+            logger.debug("Clicking 'Add New Artwork'...")
+            works_url = self.page.url
             await add_artwork_link.click()
-            
-            # Wait for form to load
-            await self.page.wait_for_load_state('networkidle')
+            # Wait for the form page's DOM rather than for the network to go quiet
+            await self.page.wait_for_url(
+                lambda url: url != works_url, wait_until='domcontentloaded'
+            )
             
             console.print(f"[green]✓ Successfully navigated to Add Artwork page![/green]")
             console.print(f"[green]Current URL: {self.page.url}[/green]")
             
-            # Save screenshot of the form for reference
-            from config.settings import SCREENSHOTS_DIR
-            screenshot_path = SCREENSHOTS_DIR / "add_artwork_form.png"
-            await self.page.screenshot(path=str(screenshot_path))
-            console.print(f"[yellow]Screenshot saved as {screenshot_path}[/yellow]")
-            
             return True
             
         except Exception as e:
             console.print(f"[red]Error navigating to Add Artwork: {e}[/red]")
             
-            # Save error screenshot
             if self.page:
-                from config.settings import SCREENSHOTS_DIR
-                screenshot_path = SCREENSHOTS_DIR / "debug_error.png"
-                await self.page.screenshot(path=str(screenshot_path))
-                console.print(f"[yellow]Error screenshot saved as {screenshot_path}[/yellow]")
+                await self._save_failure_screenshot(_DEBUG_ERROR_JPG)
             
             return False
     
+    async def _save_failure_screenshot(self, path: Path):
+        """
+        Save a screenshot of the visible page for debugging a failed step.
+        
+        A low-quality JPEG of the viewport is plenty to see where the flow
+        stopped, and much cheaper to encode than a PNG.
+        
+        Args:
+            path: Where to save the screenshot
+        """
+        await self.page.screenshot(path=str(path), type='jpeg', quality=50)
+        console.print(f"[yellow]Screenshot saved as {path}[/yellow]")
+    
     async def close(self):
         """Close the browser and cleanup."""
-        console.print("[cyan]Closing browser...[/cyan]")
-        
-        if self.context:
-            await self.context.close()
+        logger.debug("Closing browser...")
         
+        # Closing the browser closes this client's context with it
         if self.browser:
-            await self.browser.close()
+            try:
+                await asyncio.wait_for(self.browser.close(), timeout=_CLOSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                # A hung browser is ended with the Playwright driver below
+                console.print("[yellow]Browser did not close in time, stopping it[/yellow]")
+            self.browser = None
+        self.context = None
         
         if self.playwright:
             await self.playwright.stop()
+            self.playwright = None
         
-        console.print("[green]✓ Browser closed[/green]")
+        logger.debug("Browser closed")
     
     async def __aenter__(self):
         """Context manager entry."""
@@ -4,19 +4,112 @@ Uses persistent browser profile from manual_login.py (no automated login needed)
 """
 
 import asyncio
-import json
+import os
+from contextlib import suppress
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
-
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+
+import orjson
+from playwright.async_api import (
+    Error as PlaywrightError,
+    Page,
+    Response,
+    TimeoutError as PlaywrightTimeoutError,
+)
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 
+from config.settings import (
+    COOKIES_DIR,
+    FASO_INDEX_PATH,
+    FASO_UPLOAD_CONCURRENCY,
+    FASO_UPLOAD_HEADLESS,
+    METADATA_OUTPUT_PATH,
+)
+from src.app.galleries.base import default_gallery_entry, empty_gallery_sites_dict
 from src.app.galleries.browser_uploader import BaseBrowserUploader
 
 console = Console()
 
+# Readiness markers for page transitions, waited on instead of networkidle,
+# which rarely settles on pages with analytics beacons
+_UPLOAD_PAGE_READY = 'input[type="file"], :text("Select Files to Upload")'
+_SAVE_CONFIRMATION = "text=/saved|success|Upload Art/i"
+_UPLOAD_SUCCEEDED = "text=Upload succeeded"
+
+# Milliseconds FASO gets to show the upload notice, and seconds it gets once
+# the server has already answered the upload request
+_UPLOAD_NOTICE_TIMEOUT = 60000
+_NOTICE_AFTER_RESPONSE = 5
+
+# Dropdowns filled from metadata by fuzzy label match: (form field, metadata key)
+_FUZZY_SELECTS = (
+    ("Collection", "collection"),
+    ("Medium", "medium"),
+    ("Substrate", "substrate"),
+    ("Subject", "subject"),
+    ("Style", "style"),
+)
+
+# JSON files in METADATA_OUTPUT_PATH that are not painting metadata
+_NON_METADATA_FILES = frozenset({"upload_status.json", "schedule.json"})
+
+# Metadata fields kept in the scan index: enough to list pending paintings
+# and run is_upload_ready without parsing every file
+_SUMMARY_FIELDS = (
+    "filename_base", "title", "files", "medium", "substrate", "subject",
+    "style", "collection", "dimensions", "description", "gallery_sites",
+)
+
+# Seconds one painting may take up to saving its form before it is counted
+# as failed, so a stuck tab cannot hold up the rest of the batch
+_UPLOAD_TIMEOUT = 300
+
+
+def _require(label: str, get: Optional[Callable[[Dict[str, Any]], Any]] = None):
+    """Build a readiness check that reports label when the value is empty."""
+    get = get or (lambda metadata: metadata.get(label))
+    return lambda metadata: None if get(metadata) else label
+
+
+def _image_file_problem(metadata: Dict[str, Any]) -> Optional[str]:
+    """Report a missing image path, or an image path that does not exist."""
+    big_path = metadata.get("files", {}).get("big")
+    if not big_path:
+        return "image file path"
+    path = Path(big_path[0] if isinstance(big_path, list) else big_path)
+    return None if path.exists() else f"image file missing: {path.name}"
+
+
+# Checks run by is_upload_ready, in the order problems are reported; each
+# returns a description of what is missing, or None
+_READY_CHECKS: Tuple[Callable[[Dict[str, Any]], Optional[str]], ...] = (
+    _require("title", lambda metadata: metadata.get("title", {}).get("selected")),
+    _image_file_problem,
+    _require("medium"),
+    _require("substrate"),
+    _require("subject"),
+    _require("style"),
+    _require("collection"),
+    _require(
+        "dimensions",
+        lambda metadata: metadata.get("dimensions", {}).get("width")
+        and metadata["dimensions"].get("height"),
+    ),
+    _require("description"),
+)
+
+
+def _is_upload_response(response: Response) -> bool:
+    """Whether a response is the server accepting the image upload."""
+    return (
+        response.request.method == "POST"
+        and "upload" in response.url.lower()
+        and response.ok
+    )
+
 
 class FASOUploader(BaseBrowserUploader):
     """Handles uploading artwork to FASO with metadata."""
@@ -25,92 +118,122 @@ class FASOUploader(BaseBrowserUploader):
 
     @property
     def profile_dir(self) -> Path:
-        from config.settings import COOKIES_DIR
         return COOKIES_DIR / "faso_browser_profile"
 
     @property
     def dashboard_url(self) -> str:
         return "https://data.fineartstudioonline.com/cfgeditwebsite.asp?new_login=y&faso_com_auth=y"
 
-    async def upload_painting(self, metadata: Dict[str, Any]) -> bool:
+    async def upload_painting(
+        self,
+        metadata: Dict[str, Any],
+        page: Optional[Page] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
         """
         Upload a single painting to FASO.
 
         Args:
             metadata: Full metadata dict loaded from JSON file.
+            page: Tab to drive; defaults to the uploader's own page. Passing a
+                separate tab per painting lets several uploads run at once.
+            timeout: Seconds allowed to get as far as saving the form (no limit
+                if None). Saving itself is never cut short.
 
         Returns:
             True on success, False on failure.
         """
+        page = page or self.page
         title = metadata.get("title", {}).get("selected", "Unknown")
         console.print(f"\n[bold cyan]Uploading: {title}[/bold cyan]")
         self._logger.info("Starting FASO upload for '%s'", title)
 
-        if not await self._navigate_to_upload_page():
+        try:
+            if not await asyncio.wait_for(self._upload_and_fill(page, metadata), timeout):
+                return False
+        except asyncio.TimeoutError:
+            console.print(
+                f"[red]Upload of '{title}' timed out after {timeout}s. The artwork "
+                f"may be partially created; check FASO before uploading it again.[/red]"
+            )
+            self._logger.error("FASO upload of '%s' timed out after %ss", title, timeout)
             return False
 
-        image_path = self.get_image_path(metadata)
-        if not image_path or not Path(image_path).exists():
-            console.print(f"[red]Image file not found: {image_path}[/red]")
+        # Not under the timeout: cancelling after Save is clicked could leave
+        # a saved artwork reported as failed and uploaded again next run
+        if not await self._save_form(page):
             return False
 
-        if not await self._upload_image_file(image_path):
-            return False
+        console.print(f"[bold green]Successfully uploaded: {title}[/bold green]")
+        self._logger.info("FASO upload complete for '%s'", title)
+        return True
 
-        if not await self._wait_for_upload_success():
+    async def _upload_and_fill(self, page: Page, metadata: Dict[str, Any]) -> bool:
+        """Upload the image and fill in the metadata form, stopping short of saving."""
+        if not await self._navigate_to_upload_page(page):
             return False
 
-        if not await self._click_continue():
+        image_path = self.get_image_path(metadata)
+        if not image_path or not Path(image_path).exists():
+            console.print(f"[red]Image file not found: {image_path}[/red]")
             return False
 
-        if not await self._fill_metadata_form(metadata):
-            return False
+        # Listen before the upload starts so a fast reply is not missed
+        upload_response = asyncio.ensure_future(page.wait_for_event(
+            "response", predicate=_is_upload_response, timeout=60000
+        ))
+        try:
+            if not await self._upload_image_file(page, image_path):
+                return False
+
+            if not await self._wait_for_upload_success(page, upload_response):
+                return False
+        finally:
+            upload_response.cancel()
 
-        if not await self._save_form():
+        if not await self._click_continue(page):
             return False
 
-        console.print(f"[bold green]Successfully uploaded: {title}[/bold green]")
-        self._logger.info("FASO upload complete for '%s'", title)
-        return True
+        return await self._fill_metadata_form(page, metadata)
 
-    async def _navigate_to_upload_page(self) -> bool:
+    async def _navigate_to_upload_page(self, page: Page) -> bool:
         """Click 'Upload Art Now' to get to the upload page."""
         try:
-            await self.page.goto(self.dashboard_url)
-            await self.page.wait_for_load_state("networkidle")
+            await page.goto(self.dashboard_url)
 
-            upload_btn = await self.page.wait_for_selector(
+            upload_btn = await page.wait_for_selector(
                 'a.tb_link:has(img[src*="upload_2"])', timeout=30000
             )
             await upload_btn.click()
-            await self.page.wait_for_load_state("networkidle")
-            await asyncio.sleep(2)
+            # The file input is usually hidden behind the drop area, so only
+            # require it to be attached
+            await page.wait_for_selector(
+                _UPLOAD_PAGE_READY, state="attached", timeout=30000
+            )
             console.print("[green]On upload page[/green]")
             return True
         except Exception as e:
             console.print(f"[red]Could not navigate to upload page: {e}[/red]")
             self._logger.error("Could not navigate to FASO upload page: %s", e)
-            await self._take_error_screenshot("navigate")
+            await self._take_error_screenshot(page, "navigate")
             return False
 
-    async def _upload_image_file(self, file_path: str) -> bool:
+    async def _upload_image_file(self, page: Page, file_path: str) -> bool:
         """Upload an image file to FASO."""
         try:
-            file_input = await self.page.query_selector('input[type="file"]')
-            if file_input:
-                await file_input.set_input_files(file_path)
-            else:
-                async with self.page.expect_file_chooser() as fc_info:
-                    upload_area = await self.page.wait_for_selector(
+            try:
+                await page.set_input_files('input[type="file"]', file_path, timeout=5000)
+            except PlaywrightTimeoutError:
+                # No file input in the page; go through the drop area's file chooser
+                async with page.expect_file_chooser() as fc_info:
+                    upload_area = await page.wait_for_selector(
                         "text=Select Files to Upload", timeout=5000
                     )
                     await upload_area.click()
                 file_chooser = await fc_info.value
                 await file_chooser.set_files(file_path)
 
-            await asyncio.sleep(2)
-
-            upload_btn = await self.page.wait_for_selector(
+            upload_btn = await page.wait_for_selector(
                 'span[data-e2e="upload"]', timeout=5000
             )
             await upload_btn.click()
@@ -120,92 +243,99 @@ class FASOUploader(BaseBrowserUploader):
         except Exception as e:
             console.print(f"[red]Failed to upload image: {e}[/red]")
             self._logger.error("Failed to upload image file: %s", e)
-            await self._take_error_screenshot("upload_image")
+            await self._take_error_screenshot(page, "upload_image")
             return False
 
-    async def _wait_for_upload_success(self) -> bool:
-        """Wait for the 'Upload succeeded' confirmation."""
+    async def _wait_for_upload_success(
+        self, page: Page, upload_response: "asyncio.Future[Response]"
+    ) -> bool:
+        """Wait for the 'Upload succeeded' notice, cut short once the server has answered."""
+        notice = asyncio.ensure_future(
+            page.wait_for_selector(_UPLOAD_SUCCEEDED, timeout=_UPLOAD_NOTICE_TIMEOUT)
+        )
         try:
-            await self.page.wait_for_selector("text=Upload succeeded", timeout=60000)
+            done, _ = await asyncio.wait(
+                {notice, upload_response}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if notice not in done and upload_response.exception() is None:
+                # The server has the file, so the notice follows within
+                # moments; don't sit out the rest of the full wait for it
+                await asyncio.wait_for(notice, timeout=_NOTICE_AFTER_RESPONSE)
+            else:
+                # Without a matching response (the upload URL may have
+                # changed) the notice alone decides
+                await notice
             console.print("[green]Image upload succeeded[/green]")
-            await asyncio.sleep(2)
             return True
         except Exception as e:
             console.print(f"[red]Upload did not complete in time: {e}[/red]")
             self._logger.error("FASO upload timed out waiting for confirmation: %s", e)
-            await self._take_error_screenshot("upload_wait")
+            await self._take_error_screenshot(page, "upload_wait")
             return False
+        finally:
+            notice.cancel()
 
-    async def _click_continue(self) -> bool:
+    async def _click_continue(self, page: Page) -> bool:
         """Click the Continue button after upload success."""
         try:
-            continue_btn = await self.page.wait_for_selector(
+            continue_btn = await page.wait_for_selector(
                 'a:has-text("Continue"), button:has-text("Continue")', timeout=5000
             )
             await continue_btn.click()
-            await self.page.wait_for_load_state("networkidle")
-            await asyncio.sleep(2)
+            await page.wait_for_selector('input[name="Title"]', timeout=30000)
             console.print("[green]On metadata form[/green]")
             return True
         except Exception as e:
             console.print(f"[red]Could not click Continue: {e}[/red]")
             self._logger.error("Could not click Continue after upload: %s", e)
-            await self._take_error_screenshot("continue")
+            await self._take_error_screenshot(page, "continue")
             return False
 
-    async def _fill_metadata_form(self, metadata: Dict[str, Any]) -> bool:
+    async def _fill_metadata_form(self, page: Page, metadata: Dict[str, Any]) -> bool:
         """Fill in all metadata form fields."""
         try:
+            values = {}
+
             title = metadata.get("title", {}).get("selected", "")
             if title:
-                await self._fill_text_field('input[name="Title"]', title)
-
-            collection = metadata.get("collection")
-            if collection:
-                await self._select_dropdown_fuzzy('select[name="Collection"]', collection)
-
-            medium = metadata.get("medium")
-            if medium:
-                await self._select_dropdown_fuzzy('select[name="Medium"]', medium)
-
-            substrate = metadata.get("substrate")
-            if substrate:
-                await self._select_dropdown_fuzzy('select[name="Substrate"]', substrate)
+                values["Title"] = title
 
             dims = metadata.get("dimensions", {})
-            height = dims.get("height")
-            width = dims.get("width")
-            depth = dims.get("depth")
-
-            if height is not None:
-                await self._fill_text_field('input[name="VerticalSize"]', str(height))
-            if width is not None:
-                await self._fill_text_field('input[name="HorizontalSize"]', str(width))
-            if depth is not None:
-                await self._fill_text_field('input[name="Depth"]', str(depth))
-
-            creation_date = metadata.get("creation_date")
-            year = self.extract_year(creation_date)
-            if year:
-                await self._select_dropdown('select[name="YearCreated"]', year)
-
-            subject = metadata.get("subject")
-            if subject:
-                await self._select_dropdown_fuzzy('select[name="Subject"]', subject)
-
-            style = metadata.get("style")
-            if style:
-                await self._select_dropdown_fuzzy('select[name="Style"]', style)
+            for name, key in (
+                ("VerticalSize", "height"), ("HorizontalSize", "width"), ("Depth", "depth"),
+            ):
+                if dims.get(key) is not None:
+                    values[name] = str(dims[key])
 
             price = metadata.get("price_eur")
             if price is not None:
-                await self._fill_text_field('input[name="RetailPrice"]', str(int(price)))
+                values["RetailPrice"] = str(int(price))
+
+            values["YearCreated"] = self.extract_year(metadata.get("creation_date"))
+            values["Availability"] = "Available"
+
+            # Map our option names onto the form's own labels before filling,
+            # so every field is set in one round-trip
+            wanted = {
+                name: metadata[key]
+                for name, key in _FUZZY_SELECTS
+                if metadata.get(key)
+            }
+            options = await self._select_options(page, list(wanted))
+            for name, value in wanted.items():
+                label = self._match_option(options[name], value)
+                if label:
+                    values[name] = label
+                else:
+                    console.print(
+                        f"[yellow]Warning: no fuzzy match for '{value}' in {name}[/yellow]"
+                    )
 
-            await self._select_dropdown('select[name="Availability"]', "Available")
+            await self._fill_form(page, values)
 
             description = metadata.get("description")
             if description:
-                await self._fill_description(description)
+                await self._fill_description(page, description)
 
             console.print("[green]Form fields filled[/green]")
             return True
@@ -213,24 +343,23 @@ class FASOUploader(BaseBrowserUploader):
         except Exception as e:
             console.print(f"[red]Error filling form: {e}[/red]")
             self._logger.error("Error filling FASO metadata form: %s", e)
-            await self._take_error_screenshot("fill_form")
+            await self._take_error_screenshot(page, "fill_form")
             return False
 
-    async def _save_form(self) -> bool:
+    async def _save_form(self, page: Page) -> bool:
         """Click Save Changes."""
         try:
-            save_btn = await self.page.wait_for_selector(
+            save_btn = await page.wait_for_selector(
                 'input[value*="Save Changes"]', timeout=5000
             )
             await save_btn.click()
-            await self.page.wait_for_load_state("networkidle")
-            await asyncio.sleep(2)
+            await page.wait_for_selector(_SAVE_CONFIRMATION, timeout=30000)
             console.print("[green]Changes saved[/green]")
             return True
         except Exception as e:
             console.print(f"[red]Could not save form: {e}[/red]")
             self._logger.error("Could not save FASO form: %s", e)
-            await self._take_error_screenshot("save")
+            await self._take_error_screenshot(page, "save")
             return False
 
     @staticmethod
@@ -241,30 +370,7 @@ class FASOUploader(BaseBrowserUploader):
         Returns:
             (is_ready, list_of_missing_field_names)
         """
-        missing = []
-
-        if not metadata.get("title", {}).get("selected"):
-            missing.append("title")
-
-        big_path = metadata.get("files", {}).get("big")
-        if not big_path:
-            missing.append("image file path")
-        else:
-            path = big_path[0] if isinstance(big_path, list) else big_path
-            if not Path(path).exists():
-                missing.append(f"image file missing: {Path(path).name}")
-
-        for field in ["medium", "substrate", "subject", "style", "collection"]:
-            if not metadata.get(field):
-                missing.append(field)
-
-        dims = metadata.get("dimensions", {})
-        if not dims.get("width") or not dims.get("height"):
-            missing.append("dimensions")
-
-        if not metadata.get("description"):
-            missing.append("description")
-
+        missing = [problem for check in _READY_CHECKS if (problem := check(metadata))]
         return (len(missing) == 0, missing)
 
 
@@ -275,38 +381,138 @@ async def _do_uploads(
     succeeded = []
     failed = []
 
-    async with FASOUploader(headless=False) as uploader:
+    async with FASOUploader(headless=FASO_UPLOAD_HEADLESS) as uploader:
         if not await uploader.start_browser():
             return succeeded, failed
 
-        for filename, metadata in paintings:
-            success = await uploader.upload_painting(metadata)
+        slots = asyncio.Semaphore(FASO_UPLOAD_CONCURRENCY)
+
+        async def upload_one(index: int, metadata: Dict[str, Any]) -> Tuple[int, bool]:
+            # Any error stays with its own painting, so uploads that already
+            # finished are still reported and marked
+            try:
+                async with slots:
+                    # Tabs share the persistent profile's session; a separate
+                    # BrowserContext would start logged out
+                    page = await uploader.context.new_page()
+                    try:
+                        return index, await uploader.upload_painting(
+                            metadata, page, timeout=_UPLOAD_TIMEOUT
+                        )
+                    finally:
+                        with suppress(PlaywrightError):
+                            await page.close()
+            except Exception as e:
+                console.print(f"[red]Upload of {paintings[index][0]} failed: {e}[/red]")
+                uploader._logger.error("FASO upload of %s failed: %s", paintings[index][0], e)
+            return index, False
+
+        # Report each painting as it finishes rather than after the slowest
+        results = [False] * len(paintings)
+        tasks = [
+            asyncio.create_task(upload_one(i, metadata))
+            for i, (_, metadata) in enumerate(paintings)
+        ]
+        for done, task in enumerate(asyncio.as_completed(tasks), 1):
+            index, success = await task
+            results[index] = success
+            status = "[green]uploaded[/green]" if success else "[red]failed[/red]"
+            console.print(f"[{done}/{len(paintings)}] {paintings[index][0]}: {status}")
+
+    for (filename, _), success in zip(paintings, results):
+        if success:
+            succeeded.append(filename)
+        else:
+            failed.append(filename)
+
+    return succeeded, failed
 
-            if success:
-                succeeded.append(filename)
-            else:
-                failed.append(filename)
 
-            if paintings.index((filename, metadata)) < len(paintings) - 1:
-                await asyncio.sleep(2)
+def _load_metadata(metadata_path: Path) -> Dict[str, Any]:
+    """Read a full metadata JSON file."""
+    with open(metadata_path, "rb") as f:
+        return orjson.loads(f.read())
 
-    return succeeded, failed
+
+def _load_index(index_path: Path) -> Dict[str, Any]:
+    """Read the metadata index, or start an empty one if it is missing or unreadable."""
+    try:
+        with open(index_path, "rb") as f:
+            index = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _save_index(index_path: Path, index: Dict[str, Any]):
+    """Write the metadata index atomically; a failed write only costs a rescan."""
+    tmp_file = index_path.with_name(index_path.name + ".tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(index))
+        os.replace(tmp_file, index_path)
+    except OSError:
+        pass
+
+
+def _iter_json_entries(root: Path) -> Iterator[os.DirEntry]:
+    """Yield metadata JSON files under root, filtering by name before any stat or read."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    elif (
+                        entry.name.endswith(".json")
+                        and entry.name not in _NON_METADATA_FILES
+                        and entry.is_file()
+                    ):
+                        yield entry
+        except FileNotFoundError:
+            continue
 
 
 def _find_all_metadata_files() -> list:
-    """Scan processed-metadata for all JSON metadata files."""
-    from config.settings import METADATA_OUTPUT_PATH
+    """
+    Scan processed-metadata for all JSON metadata files.
+
+    Only files whose mtime or size changed since the last scan are parsed;
+    the rest come from FASO_INDEX_PATH. Each result holds just the fields
+    the pending-upload table needs (see _SUMMARY_FIELDS), so callers load
+    the full file with _load_metadata before uploading it.
+
+    Returns:
+        List of (metadata_path, summary) tuples
+    """
+    index = _load_index(FASO_INDEX_PATH)
+    fresh = {}
     results = []
-    for json_file in METADATA_OUTPUT_PATH.rglob("*.json"):
-        if json_file.name in ("upload_status.json", "schedule.json"):
-            continue
+    for dir_entry in _iter_json_entries(METADATA_OUTPUT_PATH):
         try:
-            with open(json_file, "r") as f:
-                metadata = json.load(f)
-            if "filename_base" in metadata:
-                results.append((json_file, metadata))
-        except (json.JSONDecodeError, KeyError):
+            stat = dir_entry.stat()
+        except OSError:
             continue
+        key = dir_entry.path
+        json_file = Path(key)
+        entry = index.get(key)
+        if not isinstance(entry, dict) or entry.get("stamp") != [stat.st_mtime_ns, stat.st_size]:
+            try:
+                metadata = _load_metadata(json_file)
+            except (OSError, orjson.JSONDecodeError):
+                continue
+            summary = None
+            if isinstance(metadata, dict) and "filename_base" in metadata:
+                summary = {k: metadata[k] for k in _SUMMARY_FIELDS if k in metadata}
+            entry = {"stamp": [stat.st_mtime_ns, stat.st_size], "summary": summary}
+        fresh[key] = entry
+        if entry.get("summary") is not None:
+            results.append((json_file, entry["summary"]))
+
+    if fresh != index:
+        _save_index(FASO_INDEX_PATH, fresh)
     return results
 
 
@@ -318,18 +524,18 @@ def _is_faso_pending(metadata: dict) -> bool:
 
 
 def _mark_faso_uploaded(metadata_path: Path, metadata: dict):
-    """Update gallery_sites.faso.last_uploaded in metadata JSON."""
+    """Update gallery_sites.faso.last_uploaded in metadata JSON (atomically, via a temp file and rename)."""
     if "gallery_sites" not in metadata:
-        from src.app.galleries.base import empty_gallery_sites_dict
         metadata["gallery_sites"] = empty_gallery_sites_dict()
     if "faso" not in metadata["gallery_sites"]:
-        from src.app.galleries.base import default_gallery_entry
         metadata["gallery_sites"]["faso"] = default_gallery_entry()
 
     metadata["gallery_sites"]["faso"]["last_uploaded"] = datetime.now().isoformat()
 
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    tmp_file = metadata_path.with_name(metadata_path.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, metadata_path)
 
 
 def upload_faso_cli():
@@ -405,7 +611,8 @@ def upload_faso_cli():
         if not Confirm.ask(f"Upload {len(to_upload)} painting(s) to FASO?", default=True):
             return
 
-    upload_pairs = [(fn, meta) for fn, meta, _ in to_upload]
+    loaded = {fn: (mp, _load_metadata(mp)) for fn, _, mp in to_upload}
+    upload_pairs = [(fn, meta) for fn, (_, meta) in loaded.items()]
     console.print("\n[cyan]Starting browser for upload...[/cyan]")
     succeeded, failed = asyncio.run(_do_uploads(upload_pairs))
 
@@ -418,15 +625,9 @@ def upload_faso_cli():
         console.print(f"\n[bold]Mark uploads as complete?[/bold]")
         console.print("[dim]You can re-upload later if you don't mark them now.[/dim]")
 
-        path_lookup = {fn: mp for fn, _, mp in to_upload}
-
         for filename in succeeded:
             if Confirm.ask(f"  Mark '{filename}' as uploaded?", default=True):
-                mp = path_lookup.get(filename)
-                if mp:
-                    with open(mp, "r") as f:
-                        meta = json.load(f)
-                    _mark_faso_uploaded(mp, meta)
+                _mark_faso_uploaded(*loaded[filename])
                 console.print(f"    [green]Marked done[/green]")
             else:
                 console.print(f"    [yellow]Kept pending (can re-upload)[/yellow]")
@@ -6,48 +6,76 @@ Each line format:
     [YYYY-MM-DD HH:MM:SS] [user|cron] <action description>
 """
 
+import atexit
+import os
 import sys
-from datetime import datetime
+import time
+from functools import cache, lru_cache
 from pathlib import Path
 
+from config.settings import ensure_dir
+
 _LOG_FILE = Path("~/.config/theo-van-gogh/activity_log.txt").expanduser()
 
-_ADMIN_ACTION_NAMES = {
-    1: "Edit Anthropic API Key",
-    2: "Edit File Paths",
-    3: "Edit Dimension Unit",
-    4: "Add to Lists",
-    5: "Manage Social Media Platforms",
-    6: "Sync Collection Folders",
-    7: "View Current Settings",
-    8: "Generate Skeleton Metadata",
-    9: "Edit Metadata",
-    10: "Sync Instagram Folders",
-    11: "Upload to FASO",
-    12: "Find Painting",
-    13: "Post to Social Media",
-    14: "Schedule Posts",
-    15: "View Schedule",
-    16: "Migrate Tracking Data",
-}
+# Admin menu option names; option N is at index N - 1
+_ADMIN_ACTION_NAMES = (
+    "Edit Anthropic API Key",
+    "Edit File Paths",
+    "Edit Dimension Unit",
+    "Add to Lists",
+    "Manage Social Media Platforms",
+    "Sync Collection Folders",
+    "View Current Settings",
+    "Generate Skeleton Metadata",
+    "Edit Metadata",
+    "Sync Instagram Folders",
+    "Upload to FASO",
+    "Find Painting",
+    "Post to Social Media",
+    "Schedule Posts",
+    "View Schedule",
+    "Migrate Tracking Data",
+)
 
 
+@cache
 def get_source() -> str:
-    """Return 'user' if running interactively, 'cron' if no TTY is attached."""
+    """Return 'user' if running interactively, 'cron' if no TTY is attached.
+
+    Checked once per process; stdin does not change terminals mid-run.
+    """
     return "user" if sys.stdin.isatty() else "cron"
 
 
+@lru_cache(maxsize=1)
+def _timestamp(second: int) -> str:
+    """Format a Unix second as local time; a burst of entries in one second formats it once."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+
+
+@cache
+def _log_fd() -> int:
+    """Open the activity log for appending, once per process; closed at exit."""
+    ensure_dir(_LOG_FILE.parent)
+    fd = os.open(_LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    atexit.register(os.close, fd)
+    return fd
+
+
 def log_activity(action: str) -> None:
     """Append a timestamped activity entry to the activity log."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = _timestamp(int(time.time()))
     source = get_source()
     line = f"[{timestamp}] [{source}] {action}\n"
-    _LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(_LOG_FILE, "a") as f:
-        f.write(line)
+    # O_APPEND makes each single write land whole at the end of the file,
+    # even with cron and an interactive session logging at once
+    os.write(_log_fd(), line.encode())
 
 
 def log_admin_action(choice: int) -> None:
     """Log an admin menu selection by its numeric choice."""
-    name = _ADMIN_ACTION_NAMES.get(choice, f"Option {choice}")
+    if 1 <= choice <= len(_ADMIN_ACTION_NAMES):
+        name = _ADMIN_ACTION_NAMES[choice - 1]
+    else:
+        name = f"Option {choice}"
     log_activity(f"Admin menu: {name}")
@@ -3,19 +3,143 @@ Admin mode for managing configuration settings.
 Allows editing settings.py through interactive CLI.
 """
 
+import ast
+import os
 import re
+import stat
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.table import Table
-from rich.panel import Panel
 
 from src.app.services.activity_log import log_admin_action
 
 console = Console()
 
+# Main menu option -> AdminMode method that handles it
+_ACTIONS = {
+    1: "edit_api_key",
+    2: "edit_file_paths",
+    3: "edit_dimension_unit",
+    4: "add_to_list",
+    5: "manage_social_platforms",
+    6: "sync_collection_folders",
+    7: "view_current_settings",
+    8: "generate_skeleton_metadata",
+    9: "edit_metadata",
+    10: "sync_instagram_folders",
+    11: "upload_to_faso",
+    12: "find_painting",
+    13: "post_to_social_media",
+    14: "schedule_posts",
+    15: "view_schedule",
+    16: "migrate_tracking",
+    17: "manual_site_login",
+}
+
+# Main menu options, then 0 to exit
+_MENU_CHOICES = [*map(str, _ACTIONS), "0"]
+
+_DIM_UNIT_RE = re.compile(r'DIMENSION_UNIT\s*=\s*"(\w+)"')
+
+# Editable lists in settings.py: menu key -> (variable name, display name)
+_LISTS = {
+    "1": ("SUBSTRATES", "Substrate"),
+    "2": ("MEDIUMS", "Medium"),
+    "3": ("SUBJECTS", "Subject"),
+    "4": ("STYLES", "Style"),
+    "5": ("COLLECTIONS", "Collection"),
+}
+_LIST_CHOICES = [*_LISTS, "0"]
+
+# The API key assignment in .env; group 1 is the value
+_API_KEY_RE = re.compile(r'^ANTHROPIC_API_KEY=([^\r\n]*)', re.MULTILINE)
+
+
+def _list_literals(content: str) -> Dict[str, ast.List]:
+    """
+    Find the top-level list literals assigned in settings.py source.
+
+    Args:
+        content: Source text of settings.py
+
+    Returns:
+        Dictionary of variable name -> list node for its first list
+        assignment, or an empty dict if the source does not parse
+    """
+    try:
+        tree = ast.parse(content)
+    except SyntaxError:
+        return {}
+
+    lists = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.List):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    lists.setdefault(target.id, node.value)
+    return lists
+
+
+def _source_offset(content: str, lineno: int, col_offset: int) -> int:
+    """
+    Convert an AST position into an index into the source string.
+
+    Args:
+        content: Source text the AST was parsed from
+        lineno: 1-based line number
+        col_offset: UTF-8 byte offset within that line
+
+    Returns:
+        Character index into content
+    """
+    lines = content.split('\n')
+    line_start = sum(len(line) + 1 for line in lines[:lineno - 1])
+    return line_start + len(lines[lineno - 1].encode()[:col_offset].decode())
+
+
+def _write_env(env_path: Path, text: str) -> None:
+    """
+    Replace the .env file atomically, so an interrupted write cannot corrupt it.
+
+    Args:
+        env_path: Path to the .env file
+        text: New contents of the file
+    """
+    tmp_path = env_path.with_name(env_path.name + '.tmp')
+    try:
+        # The file holds API keys and passwords, so a chmod 600 must survive
+        mode = stat.S_IMODE(env_path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else mode)
+    with open(fd, 'w') as tmp:
+        if mode is not None:
+            # A temp file left by an interrupted write keeps its old mode otherwise
+            os.chmod(tmp_path, mode)
+        tmp.write(text)
+    os.replace(tmp_path, env_path)
+
+
+def _index_env(lines: List[str]) -> Dict[str, int]:
+    """
+    Map each variable assigned in .env lines to its line index.
+
+    Args:
+        lines: Lines of the .env file
+
+    Returns:
+        Dictionary of variable name -> index of the first line assigning it
+    """
+    index = {}
+    for i, line in enumerate(lines):
+        name, sep, _ = line.partition('=')
+        if sep:
+            index.setdefault(name.strip(), i)
+    return index
+
 
 class AdminMode:
     """Handles administrative configuration management."""
@@ -24,6 +148,8 @@ class AdminMode:
         """Initialize admin mode with path to settings.py."""
         self.settings_path = settings_path
         self.console = console
+        # (mtime_ns, size, text) of settings.py as last read this session
+        self._settings_cache: Optional[Tuple[int, int, str]] = None
     
     def run(self):
         """Run the admin mode menu loop."""
@@ -32,51 +158,43 @@ class AdminMode:
             self.show_main_menu()
             choice = IntPrompt.ask(
                 "\nSelect option",
-                choices=["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15", "16", "17", "0"],
+                choices=_MENU_CHOICES,
                 default="0"
             )
 
-            if choice != 0:
-                log_admin_action(choice)
-
             if choice == 0:
                 self.console.print("\n[green]Exiting admin mode[/green]")
                 break
-            elif choice == 1:
-                self.edit_api_key()
-            elif choice == 2:
-                self.edit_file_paths()
-            elif choice == 3:
-                self.edit_dimension_unit()
-            elif choice == 4:
-                self.add_to_list()
-            elif choice == 5:
-                self.manage_social_platforms()
-            elif choice == 6:
-                self.sync_collection_folders()
-            elif choice == 7:
-                self.view_current_settings()
-            elif choice == 8:
-                self.generate_skeleton_metadata()
-            elif choice == 9:
-                self.edit_metadata()
-            elif choice == 10:
-                self.sync_instagram_folders()
-            elif choice == 11:
-                self.upload_to_faso()
-            elif choice == 12:
-                self.find_painting()
-            elif choice == 13:
-                self.post_to_social_media()
-            elif choice == 14:
-                self.schedule_posts()
-            elif choice == 15:
-                self.view_schedule()
-            elif choice == 16:
-                self.migrate_tracking()
-            elif choice == 17:
-                self.manual_site_login()
+
+            log_admin_action(choice)
+            getattr(self, _ACTIONS[choice])()
     
+    def _read_settings(self) -> str:
+        """
+        Read settings.py, reusing the last read while the file is unchanged.
+
+        Returns:
+            Source text of settings.py
+        """
+        stat = self.settings_path.stat()
+        cache = self._settings_cache
+        if cache and cache[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cache[2]
+
+        content = self.settings_path.read_text()
+        self._settings_cache = (stat.st_mtime_ns, stat.st_size, content)
+        return content
+
+    def _write_settings(self, content: str):
+        """
+        Write settings.py and drop the cached copy.
+
+        Args:
+            content: New source text of settings.py
+        """
+        self.settings_path.write_text(content)
+        self._settings_cache = None
+
     def show_main_menu(self):
         """Display the main admin menu."""
         self.console.print("\n[bold cyan]═══ ADMIN MODE ═══[/bold cyan]\n")
@@ -120,18 +238,10 @@ class AdminMode:
                 return
             env_path.touch()
         
-        # Read current .env
-        with open(env_path, 'r') as f:
-            lines = f.readlines()
-        
-        # Find existing API key line
-        api_key_line_idx = None
-        current_key = None
-        for i, line in enumerate(lines):
-            if line.startswith('ANTHROPIC_API_KEY='):
-                api_key_line_idx = i
-                current_key = line.split('=', 1)[1].strip()
-                break
+        # Read current .env and find the existing API key
+        text = env_path.read_text()
+        match = _API_KEY_RE.search(text)
+        current_key = match.group(1).strip() if match else None
         
         if current_key:
             masked = current_key[:8] + "..." if len(current_key) > 8 else "***"
@@ -140,14 +250,14 @@ class AdminMode:
         new_key = Prompt.ask("Enter new API key (or press Enter to keep current)", default="")
         
         if new_key:
-            new_line = f"ANTHROPIC_API_KEY={new_key}\n"
-            if api_key_line_idx is not None:
-                lines[api_key_line_idx] = new_line
+            if match:
+                text = text[:match.start(1)] + new_key + text[match.end(1):]
             else:
-                lines.append(new_line)
+                if text and not text.endswith('\n'):
+                    text += '\n'
+                text += f"ANTHROPIC_API_KEY={new_key}\n"
             
-            with open(env_path, 'w') as f:
-                f.writelines(lines)
+            _write_env(env_path, text)
             
             self.console.print("[green]✓ API key updated[/green]")
         else:
@@ -164,8 +274,7 @@ class AdminMode:
             return
         
         # Read current .env
-        with open(env_path, 'r') as f:
-            lines = f.readlines()
+        lines = env_path.read_text().splitlines(keepends=True)
         
         # Path variables to edit
         path_vars = {
@@ -175,17 +284,14 @@ class AdminMode:
         }
         
         changes_made = False
+        env_index = _index_env(lines)
         
         for var_name, description in path_vars.items():
             # Find current value
             current_value = None
-            var_line_idx = None
-            
-            for i, line in enumerate(lines):
-                if line.startswith(f'{var_name}='):
-                    var_line_idx = i
-                    current_value = line.split('=', 1)[1].strip()
-                    break
+            var_line_idx = env_index.get(var_name)
+            if var_line_idx is not None:
+                current_value = lines[var_line_idx].split('=', 1)[1].strip()
             
             self.console.print(f"\n[cyan]{description}[/cyan]")
             if current_value:
@@ -202,8 +308,7 @@ class AdminMode:
                 changes_made = True
         
         if changes_made:
-            with open(env_path, 'w') as f:
-                f.writelines(lines)
+            _write_env(env_path, ''.join(lines))
             self.console.print("\n[green]✓ File paths updated[/green]")
         else:
             self.console.print("\n[yellow]No changes made[/yellow]")
@@ -213,11 +318,10 @@ class AdminMode:
         self.console.print("\n[bold]Edit Dimension Unit[/bold]")
         
         # Read settings file
-        with open(self.settings_path, 'r') as f:
-            content = f.read()
+        content = self._read_settings()
         
         # Find current unit
-        match = re.search(r'DIMENSION_UNIT\s*=\s*"(\w+)"', content)
+        match = _DIM_UNIT_RE.search(content)
         current_unit = match.group(1) if match else "cm"
         
         self.console.print(f"[dim]Current unit: {current_unit}[/dim]")
@@ -230,15 +334,10 @@ class AdminMode:
         
         new_unit = "cm" if choice == 1 else "in"
         
-        # Replace in file
-        new_content = re.sub(
-            r'DIMENSION_UNIT\s*=\s*"(\w+)"',
-            f'DIMENSION_UNIT = "{new_unit}"',
-            content
-        )
-        
-        with open(self.settings_path, 'w') as f:
-            f.write(new_content)
+        # Replace the quoted value in place, reusing the match found above
+        if match:
+            start, end = match.span(1)
+            self._write_settings(content[:start] + new_unit + content[end:])
         
         self.console.print(f"[green]✓ Dimension unit set to: {new_unit}[/green]")
     
@@ -246,31 +345,23 @@ class AdminMode:
         """Add new entries to configuration lists."""
         self.console.print("\n[bold]Add to Configuration Lists[/bold]")
         
-        lists = {
-            "1": ("SUBSTRATES", "Substrate"),
-            "2": ("MEDIUMS", "Medium"),
-            "3": ("SUBJECTS", "Subject"),
-            "4": ("STYLES", "Style"),
-            "5": ("COLLECTIONS", "Collection"),
-        }
-        
         # Show menu
         table = Table(show_header=False)
         table.add_column("Option", style="cyan", width=8)
         table.add_column("List")
         
-        for key, (var_name, display_name) in lists.items():
+        for key, (var_name, display_name) in _LISTS.items():
             table.add_row(key, display_name + "s")
         table.add_row("0", "Back to main menu")
         
         self.console.print(table)
         
-        choice = Prompt.ask("\nSelect list to add to", choices=list(lists.keys()) + ["0"])
+        choice = Prompt.ask("\nSelect list to add to", choices=_LIST_CHOICES)
         
         if choice == "0":
             return
         
-        var_name, display_name = lists[choice]
+        var_name, display_name = _LISTS[choice]
         
         # Get new entry
         new_entry = Prompt.ask(f"\nEnter new {display_name.lower()}")
@@ -280,22 +371,25 @@ class AdminMode:
             return
         
         # Read settings file
-        with open(self.settings_path, 'r') as f:
-            content = f.read()
+        content = self._read_settings()
         
         # Find the list and add entry
-        # Pattern: LISTNAME = [\n    "item1",\n    "item2",\n]
-        pattern = f'{var_name}\\s*=\\s*\\[(.*?)\\]'
-        match = re.search(pattern, content, re.DOTALL)
-        
-        if match:
-            list_content = match.group(1)
+        # Layout: LISTNAME = [\n    "item1",\n    "item2",\n]
+        node = _list_literals(content).get(var_name)
+        
+        if node is not None:
+            close = _source_offset(content, node.end_lineno, node.end_col_offset) - 1
+            head = content[:close].rstrip()
+            if node.elts:
+                # Make sure the current last entry is followed by a comma
+                last = node.elts[-1]
+                last_end = _source_offset(content, last.end_lineno, last.end_col_offset)
+                if not content[last_end:close].lstrip().startswith(','):
+                    head = head[:last_end] + ',' + head[last_end:]
             # Add new entry before the closing bracket
-            new_list_content = list_content.rstrip() + f'\n    "{new_entry}",\n'
-            new_content = content.replace(match.group(0), f'{var_name} = [{new_list_content}]')
+            new_content = head + f'\n    "{new_entry}",\n' + content[close:]
             
-            with open(self.settings_path, 'w') as f:
-                f.write(new_content)
+            self._write_settings(new_content)
             
             self.console.print(f'[green]✓ Added "{new_entry}" to {display_name}s[/green]')
         else:
@@ -339,45 +433,34 @@ class AdminMode:
         env_path = self.settings_path.parent.parent / ".env"
         
         if env_path.exists():
-            with open(env_path, 'r') as f:
-                env_content = f.read()
+            env_content = env_path.read_text()
             
             # Extract key settings
             api_key = None
-            for line in env_content.split('\n'):
-                if line.startswith('ANTHROPIC_API_KEY='):
-                    key = line.split('=', 1)[1].strip()
-                    api_key = key[:8] + "..." if len(key) > 8 else "***"
+            match = _API_KEY_RE.search(env_content)
+            if match:
+                key = match.group(1).strip()
+                api_key = key[:8] + "..." if len(key) > 8 else "***"
             
             if api_key:
                 self.console.print(f"[cyan]API Key:[/cyan] {api_key}")
         
         # Read settings.py
-        with open(self.settings_path, 'r') as f:
-            content = f.read()
+        content = self._read_settings()
         
         # Extract dimension unit
-        match = re.search(r'DIMENSION_UNIT\s*=\s*"(\w+)"', content)
+        match = _DIM_UNIT_RE.search(content)
         if match:
             self.console.print(f"[cyan]Dimension Unit:[/cyan] {match.group(1)}")
         
         # Show list counts
-        lists = {
-            "SUBSTRATES": "Substrates",
-            "MEDIUMS": "Mediums",
-            "SUBJECTS": "Subjects",
-            "STYLES": "Styles",
-            "COLLECTIONS": "Collections",
-        }
-        
-        self.console.print("\n[bold]List Sizes:[/bold]")
-        for var_name, display_name in lists.items():
-            pattern = f'{var_name}\\s*=\\s*\\[(.*?)\\]'
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                # Count items (rough count by counting quotes)
-                count = match.group(1).count('"') // 2
-                self.console.print(f"  {display_name}: {count} entries")
+        list_nodes = _list_literals(content)
+        rows = ["\n[bold]List Sizes:[/bold]"]
+        for var_name, display_name in _LISTS.values():
+            node = list_nodes.get(var_name)
+            if node is not None:
+                rows.append(f"  {display_name}s: {len(node.elts)} entries")
+        self.console.print("\n".join(rows))
     
     def sync_collection_folders(self):
         """Sync collection folders - create any missing folders."""
@@ -393,12 +476,14 @@ class AdminMode:
         result = sync_collection_folders_cli()
         
         # Show results
-        self.console.print(f"\n[bold]Results:[/bold]")
-        self.console.print(f"Total collections: {result['total_collections']}")
-        self.console.print(f"Folders created: {result['missing_count']}")
-        
+        rows = [
+            "\n[bold]Results:[/bold]",
+            f"Total collections: {result['total_collections']}",
+            f"Folders created: {result['missing_count']}",
+        ]
         if result['errors']:
-            self.console.print(f"[red]Errors: {len(result['errors'])}[/red]")
+            rows.append(f"[red]Errors: {len(result['errors'])}[/red]")
+        self.console.print("\n".join(rows))
         
         Prompt.ask("\nPress Enter to continue")
 
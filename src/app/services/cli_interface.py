@@ -51,6 +51,11 @@ class CLIInterface:
     def print_info(self, text: str):
         """Print info message."""
         self.console.print(f"[blue]→[/blue] {text}")
+
+    def print_stream(self, text: str):
+        """Print a chunk of streamed AI output without a trailing newline."""
+        self.console.print(text, end="", markup=False, highlight=False)
+        self.console.file.flush()
     
     
     def select_title(self, titles: List[str]) -> int:
@@ -283,10 +288,13 @@ class CLIInterface:
         
         return STYLES[choice - 1]
     
-    def select_collection(self) -> str:
+    def select_collection(self, suggested: Optional[str] = None) -> str:
         """
         Let user select collection from predefined options.
         
+        Args:
+            suggested: Collection to offer as the default (e.g. AI suggestion)
+            
         Returns:
             Selected collection
         """
@@ -301,9 +309,14 @@ class CLIInterface:
         
         self.console.print(table)
         
+        default = 1
+        if suggested in COLLECTIONS:
+            default = COLLECTIONS.index(suggested) + 1
+            self.console.print(f"[dim]Suggested collection: {suggested}[/dim]")
+        
         choice = IntPrompt.ask(
             "\nSelect collection number",
-            default=1,
+            default=default,
             choices=[str(i) for i in range(1, len(COLLECTIONS) + 1)],
         )
         
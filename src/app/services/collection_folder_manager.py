@@ -2,17 +2,23 @@
 Collection folder manager - ensures all collection folders exist.
 """
 
+import os
+import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 from rich.console import Console
 
 console = Console()
 
+# Compiled once; folder names are sanitized for every collection on each sync
+_INVALID_FOLDER_CHARS = re.compile(r'[^a-z0-9\-]')
+_DASH_RUNS = re.compile(r'-+')
+
 
 class CollectionFolderManager:
     """Manages collection folders across painting directories."""
     
-    def __init__(self, big_path: Path, instagram_path: Path, collections: List[str]):
+    def __init__(self, big_path: Path, instagram_path: Path, collections: Sequence[str]):
         """
         Initialize collection folder manager.
         
@@ -42,11 +48,10 @@ class CollectionFolderManager:
         folder_name = folder_name.replace(" ", "-")
         
         # Remove special characters
-        import re
-        folder_name = re.sub(r'[^a-z0-9\-]', '', folder_name)
+        folder_name = _INVALID_FOLDER_CHARS.sub('', folder_name)
         
         # Remove multiple consecutive dashes
-        folder_name = re.sub(r'-+', '-', folder_name)
+        folder_name = _DASH_RUNS.sub('-', folder_name)
         
         # Remove leading/trailing dashes
         folder_name = folder_name.strip('-')
@@ -63,15 +68,16 @@ class CollectionFolderManager:
         Returns:
             List of existing folder names
         """
-        if not base_path.exists():
+        # One directory read; DirEntry.is_dir uses the type the listing
+        # already returned instead of a stat per entry
+        try:
+            with os.scandir(base_path) as entries:
+                return [
+                    entry.name for entry in entries
+                    if entry.is_dir() and not entry.name.startswith('.')
+                ]
+        except FileNotFoundError:
             return []
-        
-        folders = []
-        for item in base_path.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                folders.append(item.name)
-        
-        return folders
     
     def create_missing_folders(self) -> Tuple[List[str], List[str]]:
         """
@@ -3,6 +3,7 @@ File management module for handling artwork files.
 Handles pairing instagram/big versions, renaming, and file operations.
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Optional, Tuple, List
@@ -15,9 +16,15 @@ from config.settings import (
     PAINTINGS_BIG_PATH,
     PAINTINGS_INSTAGRAM_PATH,
     SUPPORTED_IMAGE_FORMATS,
-    SANITIZE_RULES,
+    SANITIZE_TRANSLATION,
+    SANITIZE_ASCII_TABLE,
+    SANITIZE_ASCII_DELETE,
 )
 
+# Compiled once; sanitize_filename runs for every processed painting
+_INVALID_FILENAME_CHARS = re.compile(r'[^\w\s-]')
+_SEPARATOR_RUNS = re.compile(r'[_\s]+')
+
 
 class FileManager:
     """Manages artwork file operations."""
@@ -26,6 +33,8 @@ class FileManager:
         """Initialize file manager with configured paths."""
         self.big_path = PAINTINGS_BIG_PATH
         self.instagram_path = PAINTINGS_INSTAGRAM_PATH
+        # Creation dates already looked up this run, keyed by file path
+        self._creation_dates = {}
     
     def sanitize_filename(self, title: str) -> str:
         """
@@ -37,17 +46,20 @@ class FileManager:
         Returns:
             Sanitized filename (without extension)
         """
+        # Apply sanitization rules in a single translate pass
         filename = title.lower()
-        
-        # Apply sanitization rules
-        for char, replacement in SANITIZE_RULES.items():
-            filename = filename.replace(char, replacement)
+        if filename.isascii():
+            filename = filename.encode("ascii").translate(
+                SANITIZE_ASCII_TABLE, SANITIZE_ASCII_DELETE
+            ).decode("ascii")
+        else:
+            filename = filename.translate(SANITIZE_TRANSLATION)
         
         # Remove any remaining special characters
-        filename = re.sub(r'[^\w\s-]', '', filename)
+        filename = _INVALID_FILENAME_CHARS.sub('', filename)
         
         # Replace multiple underscores/spaces with single underscore
-        filename = re.sub(r'[_\s]+', '_', filename)
+        filename = _SEPARATOR_RUNS.sub('_', filename)
         
         # Remove leading/trailing underscores
         filename = filename.strip('_')
@@ -70,22 +82,45 @@ class FileManager:
         if not big_category_path.exists():
             return []
         
+        # List the instagram folder once instead of stat-ing per painting
+        instagram_names = set(self._list_image_names(instagram_category_path))
+        
         pairs = []
         
         # Find all images in big folder
-        for big_file in big_category_path.iterdir():
-            if big_file.suffix.lower() in SUPPORTED_IMAGE_FORMATS:
-                # Look for matching instagram version
-                instagram_file = instagram_category_path / big_file.name
-                
-                if instagram_file.exists():
-                    pairs.append((big_file, instagram_file))
-                else:
-                    # Only big version exists
-                    pairs.append((big_file, None))
+        for name in self._list_image_names(big_category_path):
+            big_file = big_category_path / name
+            
+            # Look for matching instagram version
+            if name in instagram_names:
+                pairs.append((big_file, instagram_category_path / name))
+            else:
+                # Only big version exists
+                pairs.append((big_file, None))
         
         return pairs
     
+    @staticmethod
+    def _list_image_names(directory: Path) -> List[str]:
+        """
+        List supported image filenames in a directory with a single scandir pass.
+        
+        Args:
+            directory: Directory to scan
+            
+        Returns:
+            Image filenames in directory order (empty if the folder is missing)
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    entry.name for entry in entries
+                    if os.path.splitext(entry.name)[1].lower() in SUPPORTED_IMAGE_FORMATS
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+    
     def get_available_categories(self) -> List[str]:
         """
         Discover all available categories from folder structure.
@@ -96,10 +131,11 @@ class FileManager:
         if not self.big_path.exists():
             return []
         
-        categories = []
-        for item in self.big_path.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                categories.append(item.name)
+        with os.scandir(self.big_path) as entries:
+            categories = [
+                entry.name for entry in entries
+                if not entry.name.startswith('.') and entry.is_dir()
+            ]
         
         return sorted(categories)
     
@@ -126,6 +162,8 @@ class FileManager:
         # Rename big version
         new_big_path = big_file.parent / f"{new_name}{big_file.suffix}"
         big_file.rename(new_big_path)
+        if big_file in self._creation_dates:
+            self._creation_dates[new_big_path] = self._creation_dates.pop(big_file)
         
         # Rename instagram version if it exists
         new_instagram_path = None
@@ -209,10 +247,11 @@ class FileManager:
         Returns:
             Date string in YYYY-MM-DD format
         """
-        # Try EXIF first
-        exif_date = self.extract_exif_date(image_path)
-        if exif_date:
-            return exif_date
+        cached = self._creation_dates.get(image_path)
+        if cached:
+            return cached
         
-        # Fall back to file creation date
-        return self.get_file_creation_date(image_path)
+        # Try EXIF first, then fall back to file creation date
+        date = self.extract_exif_date(image_path) or self.get_file_creation_date(image_path)
+        self._creation_dates[image_path] = date
+        return date
@@ -5,12 +5,15 @@ File organizer for moving processed paintings to collection-based folders.
 import re
 import json
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 from rich.console import Console
 
 console = Console()
 
+# Compiled once; sanitize_collection_name runs for every organized painting
+_INVALID_FOLDER_CHARS = re.compile(r'[^\w\-]')
+
 
 class FileOrganizer:
     """Organizes processed paintings into collection-based folders."""
@@ -27,6 +30,8 @@ class FileOrganizer:
         self.big_path = big_path
         self.instagram_path = instagram_path
         self.metadata_path = metadata_path
+        # Where each painting's metadata JSON ended up, by filename base
+        self.organized: Dict[str, Path] = {}
     
     def sanitize_collection_name(self, collection: str) -> str:
         """
@@ -46,7 +51,7 @@ class FileOrganizer:
         sanitized = sanitized.replace(" ", "-")
         
         # Remove any other special characters
-        sanitized = re.sub(r'[^\w\-]', '', sanitized)
+        sanitized = _INVALID_FOLDER_CHARS.sub('', sanitized)
         
         return sanitized
     
@@ -128,6 +133,7 @@ class FileOrganizer:
         if old_txt.exists():
             old_txt.unlink()
         
+        self.organized[filename_base] = new_metadata_file
         return True, f"Moved to {collection_folder}/"
     
     def _move_file(self, base_path: Path, from_category: str, filename_base: str, to_category: str) -> Tuple[bool, Path]:
@@ -194,12 +200,14 @@ class FileOrganizer:
         Organize all paintings in the new-paintings folder.
         
         Returns:
-            Dict with success counts and errors
+            Dict with success counts, errors and the new metadata path of
+            each organized painting (by filename base)
         """
         results = {
             "processed": 0,
             "success": 0,
-            "errors": []
+            "errors": [],
+            "metadata_paths": {},
         }
         
         # Get all metadata files in new-paintings
@@ -216,6 +224,7 @@ class FileOrganizer:
             
             if success:
                 results["success"] += 1
+                results["metadata_paths"][filename_base] = self.organized[filename_base]
                 console.print(f"[green]✓[/green] {filename_base}: {message}")
             else:
                 results["errors"].append(f"{filename_base}: {message}")
@@ -4,14 +4,21 @@ Generates titles and descriptions for artwork.
 """
 
 import base64
-import json
+import hashlib
+import re
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import orjson
 from anthropic import Anthropic
-from PIL import Image
+from PIL import Image, ImageOps
 
 from config.settings import (
+    AI_CACHE_DIR,
+    AI_IMAGE_CACHE_SIZE,
+    AI_IMAGE_MAX_DIMENSION,
     ANTHROPIC_API_KEY,
     CLAUDE_MODEL,
     MAX_TOKENS,
@@ -19,11 +26,52 @@ from config.settings import (
 from config.prompts import (
     TITLE_GENERATION_PROMPT,
     DESCRIPTION_GENERATION_PROMPT,
+    TITLE_SYSTEM_BLOCKS,
+    TITLE_REQUEST_PROMPT,
+    ANALYSIS_PROMPT,
+    ANALYSIS_SYSTEM_BLOCKS,
+    DESCRIPTION_SYSTEM_BLOCKS,
+    build_description_details,
+    build_category_choices,
 )
 from src.core.logger import get_logger
 
 logger = get_logger("metadata")
 
+# A reply wrapped in a Markdown code fence, with or without a language tag
+_CODE_FENCE_RE = re.compile(r"^\s*```[\w-]*\s*\n?(.*?)\n?\s*```\s*$", re.DOTALL)
+
+
+def _loads_reply(text: str) -> Any:
+    """
+    Parse a JSON reply from the model, tolerating a code fence or stray prose.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        The parsed JSON value
+
+    Raises:
+        orjson.JSONDecodeError: If no JSON value can be recovered
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+
+    match = _CODE_FENCE_RE.match(text)
+    if match:
+        text = match.group(1)
+    # Fall back to the outermost object or array, dropping any text around it
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    if starts:
+        start = min(starts)
+        end = text.rfind("}" if text[start] == "{" else "]")
+        if end > start:
+            text = text[start:end + 1]
+    return orjson.loads(text)
+
 
 class ImageAnalyzer:
     """Handles AI-powered image analysis for artwork."""
@@ -35,19 +83,10 @@ class ImageAnalyzer:
         
         self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
         self.model = CLAUDE_MODEL
-    
-    def _encode_image(self, image_path: Path) -> str:
-        """
-        Encode image to base64 string.
-        
-        Args:
-            image_path: Path to the image file
-            
-        Returns:
-            Base64 encoded image string
-        """
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
+        self.cache_dir = AI_CACHE_DIR
+        # Titles, description and social text all upload the same image, so
+        # keep recently prepared ones keyed on (path, mtime_ns, size)
+        self._prepared_images = lru_cache(maxsize=AI_IMAGE_CACHE_SIZE)(self._read_image)
     
     def _get_image_media_type(self, image_path: Path) -> str:
         """
@@ -66,6 +105,164 @@ class ImageAnalyzer:
             ".png": "image/png",
         }
         return media_types.get(suffix, "image/jpeg")
+
+    def _cache_key(self, image_digest: str, *parts: str) -> str:
+        """
+        Build a content-addressed cache key for an AI result.
+
+        The key covers the image bytes, the model and every prompt input,
+        so renaming a file still hits the cache while editing a prompt
+        (or switching model) invalidates it.
+
+        Args:
+            image_digest: SHA-256 hex digest of the image file
+            *parts: Prompt text and inputs that affect the result
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha256(image_digest.encode("ascii"))
+        for part in (self.model, *parts):
+            digest.update(b"\0")
+            digest.update(part.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _cache_file(self, kind: str, key: str) -> Path:
+        """
+        Path of a cache entry, sharded by the first two hex digits of the key
+        so no single directory grows with the whole archive.
+
+        Args:
+            kind: Result type ("titles", "analysis" or "description")
+            key: Cache key from _cache_key
+
+        Returns:
+            Path to the cache file
+        """
+        return self.cache_dir / key[:2] / f"{kind}_{key}.json"
+
+    def _cache_get(self, kind: str, key: str) -> Any:
+        """
+        Return a cached AI result, or None on a miss.
+
+        Args:
+            kind: Result type ("titles", "analysis" or "description")
+            key: Cache key from _cache_key
+
+        Returns:
+            Cached value or None
+        """
+        cache_file = self._cache_file(kind, key)
+        try:
+            with open(cache_file, "rb") as f:
+                return orjson.loads(f.read())["result"]
+        except FileNotFoundError:
+            return None
+        except (orjson.JSONDecodeError, TypeError, KeyError, OSError) as e:
+            logger.warning("Ignoring unreadable AI cache file %s: %s", cache_file, e)
+            return None
+
+    def _cache_put(self, kind: str, key: str, result: Any) -> None:
+        """
+        Store an AI result in the on-disk cache (best effort).
+
+        Args:
+            kind: Result type ("titles", "analysis" or "description")
+            key: Cache key from _cache_key
+            result: JSON-serialisable value to store
+        """
+        cache_file = self._cache_file(kind, key)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                f.write(orjson.dumps({"result": result}))
+        except (OSError, TypeError) as e:
+            logger.warning("Could not write AI cache entry: %s", e)
+
+    def _prepare_image(self, image_path: Path, image_data: bytes) -> tuple:
+        """
+        Load an image for upload, downscaling it if it is larger than needed.
+
+        Images within AI_IMAGE_MAX_DIMENSION are sent as-is. Larger ones are
+        resized to fit and re-encoded as JPEG, which cuts upload time and
+        vision token cost with no practical loss for titling/description.
+
+        Args:
+            image_path: Path to the image file
+            image_data: Raw bytes of the image file
+
+        Returns:
+            Tuple of (media_type, base64 encoded image string)
+        """
+        with Image.open(BytesIO(image_data)) as img:
+            if max(img.size) <= AI_IMAGE_MAX_DIMENSION:
+                return (
+                    self._get_image_media_type(image_path),
+                    base64.b64encode(image_data).decode("utf-8"),
+                )
+
+            # Re-encoding drops the EXIF Orientation tag, so apply it to the
+            # pixels first or rotated camera photos are sent sideways
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail((AI_IMAGE_MAX_DIMENSION, AI_IMAGE_MAX_DIMENSION), Image.LANCZOS)
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            buffer = BytesIO()
+            img.save(buffer, "JPEG", quality=85, optimize=True)
+
+        return "image/jpeg", base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+    def _image_block(self, image_path: Path, image_data: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Build the base64 image content block for a Claude message.
+
+        Args:
+            image_path: Path to the image file
+            image_data: Image bytes if the caller has already read the file
+
+        Returns:
+            Image content block dictionary
+        """
+        if image_data is None:
+            image_data = image_path.read_bytes()
+        media_type, data = self._prepare_image(image_path, image_data)
+        return {
+            "type": "image",
+            "source": {
+                "type": "base64",
+                "media_type": media_type,
+                "data": data,
+            },
+        }
+    
+    def _read_image(self, path: str, mtime_ns: int, size: int) -> Tuple[str, Dict[str, Any]]:
+        """
+        Read an image and build its content block (wrapped by the LRU in __init__).
+
+        Args:
+            path: Path to the image file
+            mtime_ns: Modification time, so an edited file misses the cache
+            size: File size in bytes, for the same reason
+
+        Returns:
+            Tuple of (SHA-256 hex digest of the file, image content block)
+        """
+        image_path = Path(path)
+        image_data = image_path.read_bytes()
+        return hashlib.sha256(image_data).hexdigest(), self._image_block(image_path, image_data)
+
+    def _load_image(self, image_path: Path) -> Tuple[str, Dict[str, Any]]:
+        """
+        Return the digest and content block for an image, reusing recent ones.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Tuple of (SHA-256 hex digest of the file, image content block)
+        """
+        stat = image_path.stat()
+        return self._prepared_images(str(image_path), stat.st_mtime_ns, stat.st_size)
     
     def generate_titles(self, image_path: Path) -> List[str]:
         """
@@ -77,31 +274,31 @@ class ImageAnalyzer:
         Returns:
             List of 10 title strings
         """
-        print(f"  → Analyzing image for title generation...")
-        
-        # Encode image
-        image_data = self._encode_image(image_path)
-        media_type = self._get_image_media_type(image_path)
+        # Logged rather than printed: titles are usually prefetched on a
+        # worker thread while the user is answering prompts
+        logger.debug("Generating titles for %s", image_path.name)
+
+        # The same read feeds the cache key and the upload
+        image_digest, image_block = self._load_image(image_path)
+        cache_key = self._cache_key(image_digest, TITLE_GENERATION_PROMPT, TITLE_REQUEST_PROMPT)
+        cached = self._cache_get("titles", cache_key)
+        if cached is not None:
+            logger.debug("Using cached titles for %s", image_path.name)
+            return cached
         
-        # Call Claude API
+        # Call Claude API (static instructions go in the cached system block)
         message = self.client.messages.create(
             model=self.model,
             max_tokens=MAX_TOKENS,
+            system=TITLE_SYSTEM_BLOCKS,
             messages=[
                 {
                     "role": "user",
                     "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": image_data,
-                            },
-                        },
+                        image_block,
                         {
                             "type": "text",
-                            "text": TITLE_GENERATION_PROMPT,
+                            "text": TITLE_REQUEST_PROMPT,
                         },
                     ],
                 }
@@ -113,17 +310,18 @@ class ImageAnalyzer:
         
         # Extract JSON from response
         try:
-            titles = json.loads(response_text)
-            if isinstance(titles, list) and len(titles) == 10:
-                return titles
-            else:
+            titles = _loads_reply(response_text)
+            if not (isinstance(titles, list) and len(titles) == 10):
                 raise ValueError("Response is not a list of 10 titles")
-        except (json.JSONDecodeError, ValueError) as e:
+        except (orjson.JSONDecodeError, ValueError) as e:
             print(f"  ⚠ Warning: Could not parse titles as JSON: {e}")
             print(f"  Raw response: {response_text}")
             logger.warning("Could not parse title response as JSON: %s", e)
             # Fallback: try to extract titles from text
             return self._extract_titles_from_text(response_text)
+
+        self._cache_put("titles", cache_key, titles)
+        return titles
     
     def _extract_titles_from_text(self, text: str) -> List[str]:
         """
@@ -136,7 +334,6 @@ class ImageAnalyzer:
             List of extracted titles
         """
         # Simple heuristic: look for quoted strings
-        import re
         matches = re.findall(r'"([^"]+)"', text)
         if len(matches) >= 10:
             return matches[:10]
@@ -145,6 +342,68 @@ class ImageAnalyzer:
         lines = [line.strip() for line in text.split('\n') if line.strip()]
         return lines[:10] if len(lines) >= 10 else lines + ["Untitled"] * (10 - len(lines))
     
+    def analyze_full(self, image_path: Path, categories: List[str]) -> Dict[str, Any]:
+        """
+        Generate title options and suggest a category in a single vision call.
+
+        Args:
+            image_path: Path to the artwork image
+            categories: Category names the model may choose from
+
+        Returns:
+            Dictionary with "titles" (list of 10 strings) and "category"
+            (one of categories, or None if the model gave no valid choice)
+        """
+        logger.debug("Analyzing %s", image_path.name)
+
+        choices = build_category_choices(categories)
+        image_digest, image_block = self._load_image(image_path)
+        cache_key = self._cache_key(image_digest, ANALYSIS_PROMPT, choices)
+        cached = self._cache_get("analysis", cache_key)
+        if cached is not None:
+            logger.debug("Using cached analysis for %s", image_path.name)
+            return cached
+
+        message = self.client.messages.create(
+            model=self.model,
+            max_tokens=MAX_TOKENS,
+            system=ANALYSIS_SYSTEM_BLOCKS,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        image_block,
+                        {
+                            "type": "text",
+                            "text": choices,
+                        },
+                    ],
+                }
+            ],
+        )
+
+        response_text = message.content[0].text
+
+        try:
+            analysis = _loads_reply(response_text)
+            titles = analysis["titles"]
+            if not (isinstance(titles, list) and len(titles) == 10):
+                raise ValueError("Response does not contain a list of 10 titles")
+        except (orjson.JSONDecodeError, TypeError, KeyError, ValueError) as e:
+            logger.warning("Could not parse analysis response as JSON: %s", e)
+            return {
+                "titles": self._extract_titles_from_text(response_text),
+                "category": None,
+            }
+
+        category = analysis.get("category")
+        result = {
+            "titles": titles,
+            "category": category if category in categories else None,
+        }
+        self._cache_put("analysis", cache_key, result)
+        return result
+
     def generate_description(
         self,
         image_path: Path,
@@ -153,6 +412,7 @@ class ImageAnalyzer:
         dimensions: str,
         category: str,
         user_notes: str = None,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> str:
         """
         Generate a gallery-quality description for an artwork.
@@ -164,46 +424,42 @@ class ImageAnalyzer:
             dimensions: Dimensions string (e.g., "60cm x 80cm")
             category: Category of the artwork
             user_notes: Optional notes from the artist about the painting
+            on_text: Optional callback receiving the text as it streams in
 
         Returns:
             Description text
         """
-        print(f"  → Generating description...")
+        # Logged rather than printed: the description may be generated on a
+        # worker thread while the user is still answering prompts
+        logger.debug("Generating description for %s", image_path.name)
 
-        # Encode image
-        image_data = self._encode_image(image_path)
-        media_type = self._get_image_media_type(image_path)
-
-        # Build user notes section if provided
-        user_notes_section = ""
-        if user_notes:
-            user_notes_section = f"\nArtist's Notes: {user_notes}\n"
-
-        # Format prompt with metadata
-        prompt = DESCRIPTION_GENERATION_PROMPT.format(
+        # Per-painting details go in the user turn so the system block stays cacheable
+        prompt = build_description_details(
             title=title,
             medium=medium,
             dimensions=dimensions,
             category=category,
-            user_notes_section=user_notes_section,
+            user_notes=user_notes,
         )
+
+        image_digest, image_block = self._load_image(image_path)
+        cache_key = self._cache_key(image_digest, DESCRIPTION_GENERATION_PROMPT, prompt)
+        cached = self._cache_get("description", cache_key)
+        if cached is not None:
+            logger.debug("Using cached description for %s", image_path.name)
+            if on_text:
+                on_text(cached)
+            return cached
         
-        # Call Claude API
-        message = self.client.messages.create(
+        request = dict(
             model=self.model,
             max_tokens=MAX_TOKENS,
+            system=DESCRIPTION_SYSTEM_BLOCKS,
             messages=[
                 {
                     "role": "user",
                     "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": image_data,
-                            },
-                        },
+                        image_block,
                         {
                             "type": "text",
                             "text": prompt,
@@ -212,10 +468,20 @@ class ImageAnalyzer:
                 }
             ],
         )
-        
-        # Return description text
-        return message.content[0].text.strip()
-    
+
+        # Call Claude API, streaming the text to the caller when requested
+        if on_text:
+            with self.client.messages.stream(**request) as stream:
+                for chunk in stream.text_stream:
+                    on_text(chunk)
+                description = stream.get_final_text().strip()
+        else:
+            message = self.client.messages.create(**request)
+            description = message.content[0].text.strip()
+
+        self._cache_put("description", cache_key, description)
+        return description
+
     def generate_social_description(
         self,
         image_path: Path,
@@ -235,10 +501,6 @@ class ImageAnalyzer:
         """
         print(f"  → Generating social media description...")
 
-        # Encode image
-        image_data = self._encode_image(image_path)
-        media_type = self._get_image_media_type(image_path)
-
         # Create prompt for short description
         prompt = f"""You are writing a brief, engaging social media description for this artwork titled "{title}".
 
@@ -259,14 +521,7 @@ Return ONLY the description text, nothing else. No hashtags, no title repetition
                 {
                     "role": "user",
                     "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": image_data,
-                            },
-                        },
+                        self._load_image(image_path)[1],
                         {
                             "type": "text",
                             "text": prompt,
@@ -5,7 +5,7 @@ Allows users to browse and edit metadata files interactively.
 
 import json
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from rich.console import Console
 from rich.prompt import Prompt, Confirm, IntPrompt, FloatPrompt
@@ -131,7 +131,7 @@ class MetadataEditor:
         return new_desc if new_desc else current
 
     def _prompt_select(
-        self, field_name: str, options: List[str], current: Optional[str]
+        self, field_name: str, options: Sequence[str], current: Optional[str]
     ) -> Optional[str]:
         """
         Generic list selector with 'Keep current' option.
@@ -3,12 +3,52 @@ Metadata management module.
 Handles creation of JSON and text metadata files.
 """
 
-import json
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime
 
-from config.settings import METADATA_OUTPUT_PATH
+import orjson
+
+from config.settings import (
+    METADATA_OUTPUT_PATH,
+    SUBSTRATES,
+    MEDIUMS,
+    SUBJECTS,
+    STYLES,
+    COLLECTIONS,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class PaintingDetails:
+    """Catalogue details entered by the user for one painting."""
+    width: float
+    height: float
+    depth: Optional[float]
+    dimension_unit: str
+    dimensions_formatted: str
+    substrate: str
+    medium: str
+    subject: str
+    style: str
+    collection: str
+    price_eur: float
+    creation_date: str
+
+    def __post_init__(self):
+        """Reject options that are not in the configured lists."""
+        for field_name, options in (
+            ("substrate", SUBSTRATES),
+            ("medium", MEDIUMS),
+            ("subject", SUBJECTS),
+            ("style", STYLES),
+            ("collection", COLLECTIONS),
+        ):
+            value = getattr(self, field_name)
+            if value not in options:
+                raise ValueError(f"Unknown {field_name}: {value!r}")
 
 
 class MetadataManager:
@@ -18,6 +58,8 @@ class MetadataManager:
         """Initialize metadata manager."""
         self.output_path = METADATA_OUTPUT_PATH
         self.output_path.mkdir(parents=True, exist_ok=True)
+        # Metadata filename bases per category folder, listed once per run
+        self._existing: Dict[Path, Set[str]] = {}
     
     def create_metadata(
         self,
@@ -28,18 +70,7 @@ class MetadataManager:
         selected_title: str,
         all_titles: List[str],
         description: str,
-        width: float,
-        height: float,
-        depth: float,
-        dimension_unit: str,
-        dimensions_formatted: str,
-        substrate: str,
-        medium: str,
-        subject: str,
-        style: str,
-        collection: str,
-        price_eur: float,
-        creation_date: str,
+        details: PaintingDetails,
         analyzed_from: str = "instagram",
     ) -> Dict[str, Any]:
         """
@@ -53,18 +84,7 @@ class MetadataManager:
             selected_title: The title selected by user
             all_titles: All generated title options
             description: Gallery description
-            width: Width value
-            height: Height value
-            depth: Depth value (None for flat works)
-            dimension_unit: Unit of measurement ("cm" or "in")
-            dimensions_formatted: Formatted dimensions string
-            substrate: Substrate used (paper, canvas, etc.)
-            medium: Medium used (oil, watercolor, etc.)
-            subject: Subject matter
-            style: Artistic style
-            collection: Collection name
-            price_eur: Price in euros
-            creation_date: Creation date
+            details: Dimensions, options, price and date entered by the user
             analyzed_from: Which version was used for AI analysis ("instagram" or "big")
             
         Returns:
@@ -83,19 +103,19 @@ class MetadataManager:
             },
             "description": description,
             "dimensions": {
-                "width": width,
-                "height": height,
-                "depth": depth,
-                "unit": dimension_unit,
-                "formatted": dimensions_formatted,
+                "width": details.width,
+                "height": details.height,
+                "depth": details.depth,
+                "unit": details.dimension_unit,
+                "formatted": details.dimensions_formatted,
             },
-            "substrate": substrate,
-            "medium": medium,
-            "subject": subject,
-            "style": style,
-            "collection": collection,
-            "price_eur": price_eur,
-            "creation_date": creation_date,
+            "substrate": details.substrate,
+            "medium": details.medium,
+            "subject": details.subject,
+            "style": details.style,
+            "collection": details.collection,
+            "price_eur": details.price_eur,
+            "creation_date": details.creation_date,
             "processed_date": datetime.now().isoformat(),
             "analyzed_from": analyzed_from,
             "gallery_sites": self._empty_gallery_sites(),
@@ -121,8 +141,11 @@ class MetadataManager:
         
         # Save JSON
         json_path = category_path / f"{metadata['filename_base']}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        
+        if category_path in self._existing:
+            self._existing[category_path].add(metadata['filename_base'])
         
         return json_path
     
@@ -200,6 +223,22 @@ Analyzed From: {metadata['analyzed_from']}
         
         return txt_path
     
+    def save_metadata_files(self, metadata: Dict[str, Any], category: str) -> Tuple[Path, Path]:
+        """
+        Save both the JSON and the text version of the metadata.
+        
+        Args:
+            metadata: Metadata dictionary
+            category: Category name for subfolder
+            
+        Returns:
+            Tuple of (json_path, txt_path)
+        """
+        return (
+            self.save_metadata_json(metadata, category),
+            self.save_metadata_text(metadata, category),
+        )
+    
     def create_skeleton_metadata(
         self,
         filename_base: str,
@@ -271,8 +310,8 @@ Analyzed From: {metadata['analyzed_from']}
         if not json_path.exists():
             raise FileNotFoundError(f"Metadata not found: {json_path}")
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(json_path, 'rb') as f:
+            return orjson.loads(f.read())
     
     @staticmethod
     def _empty_gallery_sites() -> dict:
@@ -297,5 +336,32 @@ Analyzed From: {metadata['analyzed_from']}
         Returns:
             True if metadata exists
         """
-        json_path = self.output_path / category / f"{filename_base}.json"
-        return json_path.exists()
+        return filename_base in self._existing_names(category)
+
+    def _existing_names(self, category: str) -> Set[str]:
+        """
+        Return the metadata filename bases in a category folder.
+
+        The folder is listed once and the set is kept up to date by
+        save_metadata_json, so batch existence checks cost one scandir
+        instead of one stat per painting.
+
+        Args:
+            category: Category name
+
+        Returns:
+            Set of filename bases that have a JSON metadata file
+        """
+        category_path = self.output_path / category
+        names = self._existing.get(category_path)
+        if names is None:
+            try:
+                with os.scandir(category_path) as entries:
+                    names = {
+                        entry.name[:-len(".json")] for entry in entries
+                        if entry.name.endswith(".json")
+                    }
+            except FileNotFoundError:
+                names = set()
+            self._existing[category_path] = names
+        return names
@@ -3,11 +3,13 @@ Upload tracker for managing social media and FASO upload status.
 Tracks which paintings have been uploaded to which platforms.
 """
 
-import json
+import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 from datetime import datetime
 
+import orjson
+
 
 class UploadTracker:
     """Manages upload status tracking for paintings across platforms."""
@@ -30,8 +32,8 @@ class UploadTracker:
     def _load_tracker(self) -> Dict:
         """Load existing tracker data or create new."""
         if self.tracker_file.exists():
-            with open(self.tracker_file, 'r') as f:
-                return json.load(f)
+            with open(self.tracker_file, 'rb') as f:
+                return orjson.loads(f.read())
         else:
             return {
                 "paintings": {},
@@ -40,10 +42,13 @@ class UploadTracker:
             }
     
     def _save_tracker(self):
-        """Save tracker data to file."""
+        """Save tracker data to file (atomically, via a temp file and rename)."""
         self.data["last_updated"] = datetime.now().isoformat()
-        with open(self.tracker_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        self.tracker_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.tracker_file.with_name(self.tracker_file.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, self.tracker_file)
     
     def add_painting(self, filename: str, metadata_path: str):
         """
@@ -53,15 +58,29 @@ class UploadTracker:
             filename: Base filename of painting
             metadata_path: Path to metadata file
         """
-        if filename not in self.data["paintings"]:
-            # Initialize with all platforms set to False (not uploaded)
-            upload_status = {platform: False for platform in self.data["platforms"]}
-            
-            self.data["paintings"][filename] = {
-                "metadata_path": str(metadata_path),
-                "processed_date": datetime.now().isoformat(),
-                "uploads": upload_status
-            }
+        self.add_paintings([(filename, metadata_path)])
+    
+    def add_paintings(self, paintings: Iterable[Tuple[str, str]]):
+        """
+        Add several newly processed paintings, saving the tracker once.
+        
+        Args:
+            paintings: (filename, metadata_path) pairs
+        """
+        added = False
+        for filename, metadata_path in paintings:
+            if filename not in self.data["paintings"]:
+                # Initialize with all platforms set to False (not uploaded)
+                upload_status = {platform: False for platform in self.data["platforms"]}
+                
+                self.data["paintings"][filename] = {
+                    "metadata_path": str(metadata_path),
+                    "processed_date": datetime.now().isoformat(),
+                    "uploads": upload_status
+                }
+                added = True
+        
+        if added:
             self._save_tracker()
     
     def mark_uploaded(self, filename: str, platform: str):
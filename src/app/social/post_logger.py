@@ -34,12 +34,12 @@ def _get_logger() -> logging.Logger:
     actually logged, and test runs that never call these functions don't
     create stray files.
     """
-    from config.settings import LOGS_DIR
+    from config.settings import LOGS_DIR, ensure_dir
 
     logger = logging.getLogger("theo.social.posts")
     if not logger.handlers:
         from datetime import datetime
-        log_file = LOGS_DIR / "social.log"
+        log_file = ensure_dir(LOGS_DIR) / "social.log"
         handler = logging.FileHandler(log_file, encoding="utf-8")
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         handler.stream.write(f"\n{'x' * 22} {now} {'x' * 22}\n")
@@ -30,6 +30,7 @@ class Scheduler:
 
     def _save(self):
         """Save schedule data to file."""
+        self.schedule_file.parent.mkdir(parents=True, exist_ok=True)
         with open(self.schedule_file, "w") as f:
             json.dump(self.data, f, indent=2)
 
@@ -2,7 +2,7 @@
 import logging
 from datetime import datetime
 
-from config.settings import LOGS_DIR
+from config.settings import LOGS_DIR, ensure_dir
 
 
 def configure_logging() -> None:
@@ -11,7 +11,7 @@ def configure_logging() -> None:
     if root.handlers:
         return
     root.setLevel(logging.DEBUG)
-    handler = logging.FileHandler(LOGS_DIR / "app.log", encoding="utf-8")
+    handler = logging.FileHandler(ensure_dir(LOGS_DIR) / "app.log", encoding="utf-8")
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     handler.stream.write(f"\n{'x' * 22} {now} {'x' * 22}\n")
     handler.setFormatter(logging.Formatter(
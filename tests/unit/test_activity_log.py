@@ -0,0 +1,53 @@
+"""Tests for the activity log."""
+
+import re
+import pytest
+
+from src.app.services import activity_log
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """Point the activity log at a temp file with a fresh descriptor."""
+    path = tmp_path / "logs" / "activity_log.txt"
+    monkeypatch.setattr(activity_log, "_LOG_FILE", path)
+    monkeypatch.setattr(activity_log, "get_source", lambda: "user")
+    activity_log._log_fd.cache_clear()
+    yield path
+    activity_log._log_fd.cache_clear()
+
+
+def test_entries_appended_in_order(log_file):
+    activity_log.log_activity("First")
+    activity_log.log_admin_action(11)
+
+    lines = log_file.read_text().splitlines()
+    assert lines[0].endswith("[user] First")
+    assert lines[1].endswith("[user] Admin menu: Upload to FASO")
+
+
+def test_existing_log_kept(log_file):
+    log_file.parent.mkdir()
+    log_file.write_text("earlier\n")
+
+    activity_log.log_activity("Later")
+
+    assert log_file.read_text().startswith("earlier\n[")
+
+
+def test_timestamp_format(log_file):
+    activity_log.log_activity("Stamped")
+
+    assert re.match(
+        r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] \[user\] Stamped$",
+        log_file.read_text().rstrip("\n"),
+    )
+
+
+def test_unknown_admin_choice_logged_by_number(log_file):
+    activity_log.log_admin_action(0)
+    activity_log.log_admin_action(99)
+
+    lines = log_file.read_text().splitlines()
+    assert lines[0].endswith("Admin menu: Option 0")
+    assert lines[1].endswith("Admin menu: Option 99")
@@ -2,11 +2,12 @@
 Unit tests for admin_mode module.
 """
 
+import stat
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from src.app.services.admin_mode import AdminMode
+from src.app.services.admin_mode import AdminMode, _ACTIONS
 
 
 @pytest.fixture
@@ -82,6 +83,10 @@ class TestRunMenuLoop:
             admin.run()
             mock_view.assert_called_once()
 
+    def test_every_option_has_a_handler(self, admin):
+        for option, name in _ACTIONS.items():
+            assert callable(getattr(admin, name)), option
+
 
 @pytest.mark.unit
 class TestEditApiKey:
@@ -93,6 +98,15 @@ class TestEditApiKey:
 
         content = env_file.read_text()
         assert "ANTHROPIC_API_KEY=sk-ant-newkey999" in content
+        assert list(env_file.parent.glob("*.tmp")) == []
+
+    def test_env_permissions_kept(self, admin, env_file):
+        env_file.chmod(0o600)
+
+        with patch("src.app.services.admin_mode.Prompt.ask", return_value="sk-ant-newkey999"):
+            admin.edit_api_key()
+
+        assert stat.S_IMODE(env_file.stat().st_mode) == 0o600
 
     def test_keep_existing_key(self, admin, env_file):
         with patch("src.app.services.admin_mode.Prompt.ask", return_value=""):
@@ -101,6 +115,17 @@ class TestEditApiKey:
         content = env_file.read_text()
         assert "ANTHROPIC_API_KEY=sk-ant-test1234567890" in content
 
+    def test_append_key_after_unterminated_line(self, admin, env_file):
+        env_file.write_text("PAINTINGS_BIG_PATH=/home/test/big")
+
+        with patch("src.app.services.admin_mode.Prompt.ask", return_value="sk-ant-newkey999"):
+            admin.edit_api_key()
+
+        assert env_file.read_text() == (
+            "PAINTINGS_BIG_PATH=/home/test/big\n"
+            "ANTHROPIC_API_KEY=sk-ant-newkey999\n"
+        )
+
     def test_create_env_if_missing(self, settings_file, tmp_path):
         # Remove .env
         env_path = tmp_path / ".env"
@@ -142,6 +167,17 @@ class TestEditFilePaths:
         assert "PAINTINGS_BIG_PATH=/new/big" in content
         assert "PAINTINGS_INSTAGRAM_PATH=/home/test/instagram" in content
 
+    def test_missing_variable_appended(self, admin, env_file):
+        env_file.write_text("ANTHROPIC_API_KEY=sk-ant-test1234567890\n")
+
+        with patch("src.app.services.admin_mode.Prompt.ask", side_effect=["", "", "/new/meta"]):
+            admin.edit_file_paths()
+
+        assert env_file.read_text() == (
+            "ANTHROPIC_API_KEY=sk-ant-test1234567890\n"
+            "METADATA_OUTPUT_PATH=/new/meta\n"
+        )
+
     def test_no_changes(self, admin, env_file):
         original = env_file.read_text()
 
@@ -197,6 +233,18 @@ class TestAddToList:
         content = settings_file.read_text()
         assert '"New Collection"' in content
 
+    def test_add_after_entry_without_trailing_comma(self, admin, settings_file):
+        settings_file.write_text(settings_file.read_text().replace('"Realism",', '"Realism"  # é'))
+
+        with patch("src.app.services.admin_mode.Prompt.ask", side_effect=["4", "Surrealism"]):
+            admin.add_to_list()
+
+        content = settings_file.read_text()
+        namespace = {}
+        exec(content, namespace)
+        assert namespace["STYLES"] == ["Realism", "Surrealism"]
+        assert '"Realism",  # é' in content
+
     def test_back_to_menu(self, admin, settings_file):
         original = settings_file.read_text()
 
@@ -214,6 +262,27 @@ class TestAddToList:
         assert settings_file.read_text() == original
 
 
+@pytest.mark.unit
+class TestSettingsCache:
+    """Test reuse of settings.py content within a session."""
+
+    def test_unchanged_file_read_once(self, admin, settings_file):
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as mock_read:
+            admin.view_current_settings()
+            admin.view_current_settings()
+
+        settings_reads = [c for c in mock_read.call_args_list if c.args[0] == settings_file]
+        assert len(settings_reads) == 1
+
+    def test_write_seen_by_next_read(self, admin, settings_file):
+        admin.view_current_settings()
+
+        with patch("src.app.services.admin_mode.IntPrompt.ask", return_value=2):
+            admin.edit_dimension_unit()
+
+        assert 'DIMENSION_UNIT = "in"' in admin._read_settings()
+
+
 @pytest.mark.unit
 class TestViewCurrentSettings:
     """Test viewing current settings."""
@@ -222,6 +291,24 @@ class TestViewCurrentSettings:
         # Should not raise
         admin.view_current_settings()
 
+    def test_counts_entries_containing_quotes(self, admin, settings_file, capsys):
+        settings_file.write_text(
+            settings_file.read_text().replace('"Realism",', '"Realism",\n    "The \\"Quoted\\" Style",')
+        )
+
+        admin.view_current_settings()
+
+        assert "Styles: 2 entries" in capsys.readouterr().out
+
+    def test_commented_out_entries_not_counted(self, admin, settings_file, capsys):
+        settings_file.write_text(
+            settings_file.read_text().replace('"Realism",', '"Realism",\n    # "Cubism",')
+        )
+
+        admin.view_current_settings()
+
+        assert "Styles: 1 entries" in capsys.readouterr().out
+
     def test_displays_without_env(self, settings_file, tmp_path):
         env_path = tmp_path / ".env"
         if env_path.exists():
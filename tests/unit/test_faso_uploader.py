@@ -1,8 +1,12 @@
 """Tests for FASO uploader helper methods (no browser needed)."""
 
+import asyncio
+import json
 import pytest
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from src.app.galleries import faso_uploader
 from src.app.galleries.faso_uploader import FASOUploader
 
 
@@ -196,3 +200,282 @@ class TestIsUploadReady:
         }
         ready, missing = FASOUploader.is_upload_ready(metadata)
         assert ready is True
+
+
+class TestDoUploads:
+    """Test the parallel upload runner with a faked browser."""
+
+    def _run(self, paintings, upload):
+        context = MagicMock()
+        context.new_page = AsyncMock(side_effect=lambda: AsyncMock())
+
+        async def start(self):
+            self.context = context
+            return True
+
+        with patch.object(FASOUploader, "start_browser", start), \
+                patch.object(FASOUploader, "close_browser", AsyncMock()), \
+                patch.object(FASOUploader, "upload_painting", upload):
+            return asyncio.run(faso_uploader._do_uploads(paintings))
+
+    def test_results_keep_painting_order(self):
+        async def upload(self, metadata, page, timeout=None):
+            await asyncio.sleep(metadata["delay"])
+            return metadata["ok"]
+
+        paintings = [
+            ("slow", {"delay": 0.02, "ok": True}),
+            ("bad", {"delay": 0, "ok": False}),
+            ("fast", {"delay": 0, "ok": True}),
+        ]
+
+        assert self._run(paintings, upload) == (["slow", "fast"], ["bad"])
+
+    def test_timeout_passed_to_each_upload(self):
+        timeouts = []
+
+        async def upload(self, metadata, page, timeout=None):
+            timeouts.append(timeout)
+            return True
+
+        self._run([("a", {}), ("b", {})], upload)
+
+        assert timeouts == [faso_uploader._UPLOAD_TIMEOUT] * 2
+
+    def test_error_in_one_upload_keeps_the_others(self):
+        async def upload(self, metadata, page, timeout=None):
+            if metadata["boom"]:
+                raise RuntimeError("browser crashed")
+            return True
+
+        paintings = [("ok", {"boom": False}), ("bad", {"boom": True}), ("ok2", {"boom": False})]
+
+        assert self._run(paintings, upload) == (["ok", "ok2"], ["bad"])
+
+    def test_uploads_one_at_a_time_by_default(self):
+        running = []
+        peak = []
+
+        async def upload(self, metadata, page, timeout=None):
+            running.append(page)
+            peak.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(page)
+            return True
+
+        self._run([(f"p{i}", {}) for i in range(3)], upload)
+
+        assert max(peak) == 1
+
+    def test_concurrency_capped(self, monkeypatch):
+        monkeypatch.setattr(faso_uploader, "FASO_UPLOAD_CONCURRENCY", 3)
+        running = []
+        peak = []
+
+        async def upload(self, metadata, page, timeout=None):
+            running.append(page)
+            peak.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(page)
+            return True
+
+        paintings = [(f"p{i}", {}) for i in range(8)]
+
+        succeeded, _ = self._run(paintings, upload)
+
+        assert len(succeeded) == 8
+        assert max(peak) == 3
+
+
+class TestFindAllMetadataFiles:
+    """Test the indexed metadata scan."""
+
+    @pytest.fixture
+    def metadata_dir(self, tmp_path, monkeypatch):
+        root = tmp_path / "processed-metadata"
+        (root / "new-paintings").mkdir(parents=True)
+        monkeypatch.setattr(faso_uploader, "METADATA_OUTPUT_PATH", root)
+        monkeypatch.setattr(faso_uploader, "FASO_INDEX_PATH", tmp_path / "index.json")
+        return root
+
+    def _write(self, path, **metadata):
+        path.write_text(json.dumps({"filename_base": path.stem, **metadata}))
+
+    def test_summaries_exclude_unneeded_fields(self, metadata_dir):
+        self._write(metadata_dir / "new-paintings" / "a.json", price_eur=100, medium="Oil")
+        (metadata_dir / "schedule.json").write_text("{}")
+        (metadata_dir / "notes.json").write_text('{"other": 1}')
+
+        ((path, summary),) = faso_uploader._find_all_metadata_files()
+
+        assert path.name == "a.json"
+        assert summary == {"filename_base": "a", "medium": "Oil"}
+
+    def test_unchanged_files_not_parsed_again(self, metadata_dir):
+        self._write(metadata_dir / "new-paintings" / "a.json")
+        faso_uploader._find_all_metadata_files()
+
+        with patch.object(faso_uploader, "_load_metadata") as load:
+            assert len(faso_uploader._find_all_metadata_files()) == 1
+        load.assert_not_called()
+
+    def test_changed_file_parsed_again(self, metadata_dir):
+        path = metadata_dir / "new-paintings" / "a.json"
+        self._write(path, medium="Oil")
+        faso_uploader._find_all_metadata_files()
+
+        self._write(path, medium="Acrylic on Canvas")
+
+        ((_, summary),) = faso_uploader._find_all_metadata_files()
+        assert summary["medium"] == "Acrylic on Canvas"
+
+    def test_corrupt_index_ignored(self, metadata_dir, tmp_path):
+        (tmp_path / "index.json").write_text("not json")
+        self._write(metadata_dir / "new-paintings" / "a.json")
+
+        assert len(faso_uploader._find_all_metadata_files()) == 1
+
+
+class TestMarkFasoUploaded:
+    """Test recording a finished upload in the metadata file."""
+
+    def test_sets_last_uploaded_in_place(self, tmp_path):
+        path = tmp_path / "a.json"
+        metadata = {"filename_base": "a", "title": {"selected": "Ünder Blue"}}
+        path.write_text(json.dumps(metadata))
+
+        faso_uploader._mark_faso_uploaded(path, metadata)
+
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert saved["gallery_sites"]["faso"]["last_uploaded"]
+        assert saved["title"]["selected"] == "Ünder Blue"
+        assert [p.name for p in tmp_path.iterdir()] == ["a.json"]
+
+
+class TestFillMetadataForm:
+    """Test that the metadata form is filled in one batch."""
+
+    def test_fields_set_in_one_call(self):
+        page = MagicMock()
+        page.evaluate = AsyncMock(side_effect=[
+            {"Medium": ["Oil", "Acrylic"], "Style": ["Abstract"]},
+            [],
+        ])
+        uploader = FASOUploader()
+        metadata = {
+            "title": {"selected": "Blue Harbour"},
+            "medium": "acrylic",
+            "style": "Cubism",
+            "dimensions": {"width": 50.0, "height": 70.0, "depth": None},
+            "price_eur": 450.0,
+            "creation_date": "2024-05-01",
+        }
+
+        assert asyncio.run(uploader._fill_metadata_form(page, metadata)) is True
+
+        assert page.evaluate.await_count == 2
+        assert page.evaluate.await_args_list[0].args[1] == ["Medium", "Style"]
+        assert page.evaluate.await_args.args[1] == {
+            "Title": "Blue Harbour",
+            "VerticalSize": "70.0",
+            "HorizontalSize": "50.0",
+            "RetailPrice": "450",
+            "YearCreated": "2024",
+            "Availability": "Available",
+            "Medium": "Acrylic",
+        }
+
+    def test_option_lists_fetched_once_per_session(self):
+        page = MagicMock()
+        page.evaluate = AsyncMock(side_effect=[{"Medium": ["Oil"]}, [], []])
+        uploader = FASOUploader()
+        metadata = {"title": {"selected": "A"}, "medium": "Oil"}
+
+        asyncio.run(uploader._fill_metadata_form(page, metadata))
+        asyncio.run(uploader._fill_metadata_form(page, metadata))
+
+        assert page.evaluate.await_count == 3
+        assert page.evaluate.await_args.args[1]["Medium"] == "Oil"
+
+
+class TestWaitForUploadSuccess:
+    """Test waiting for the 'Upload succeeded' notice."""
+
+    def _wait(self, page, outcome=None):
+        """Run the wait with the upload response resolved to outcome (pending if None)."""
+        async def run():
+            future = asyncio.get_running_loop().create_future()
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            elif outcome is not None:
+                future.set_result(outcome)
+            return await FASOUploader()._wait_for_upload_success(page, future)
+
+        return asyncio.run(run())
+
+    @staticmethod
+    def _page(notice):
+        page = MagicMock()
+        page.wait_for_selector = notice
+        page.screenshot = AsyncMock()
+        return page
+
+    def test_notice_ends_wait_without_response(self):
+        page = self._page(AsyncMock())
+
+        assert self._wait(page) is True
+        page.wait_for_selector.assert_awaited_once_with(
+            "text=Upload succeeded", timeout=60000
+        )
+
+    def test_notice_checked_after_response(self):
+        assert self._wait(self._page(AsyncMock()), MagicMock()) is True
+
+    def test_missing_notice_fails_despite_response(self):
+        notice = AsyncMock(side_effect=faso_uploader.PlaywrightError("timeout"))
+
+        assert self._wait(self._page(notice), MagicMock()) is False
+
+    def test_response_cuts_notice_wait_short(self, monkeypatch):
+        monkeypatch.setattr(faso_uploader, "_NOTICE_AFTER_RESPONSE", 0.01)
+
+        async def never_shown(*args, **kwargs):
+            await asyncio.sleep(60)
+
+        assert self._wait(self._page(never_shown), MagicMock()) is False
+
+    def test_falls_back_to_notice_when_no_response_matches(self):
+        page = self._page(AsyncMock())
+
+        assert self._wait(page, faso_uploader.PlaywrightError("timeout")) is True
+        page.wait_for_selector.assert_awaited_once()
+
+
+class TestUploadPaintingTimeout:
+    """Test the per-painting time limit."""
+
+    def test_stuck_upload_fails_without_saving(self):
+        uploader = FASOUploader()
+
+        async def stuck(page, metadata):
+            await asyncio.sleep(1)
+            return True
+
+        with patch.object(uploader, "_upload_and_fill", stuck), \
+                patch.object(uploader, "_save_form", AsyncMock()) as save, \
+                patch.object(faso_uploader.console, "print") as printed:
+            assert asyncio.run(uploader.upload_painting({}, MagicMock(), timeout=0.01)) is False
+
+        save.assert_not_called()
+        assert "check FASO" in printed.call_args.args[0]
+
+    def test_save_not_cut_short_by_timeout(self):
+        uploader = FASOUploader()
+
+        async def slow_save(page):
+            await asyncio.sleep(0.05)
+            return True
+
+        with patch.object(uploader, "_upload_and_fill", AsyncMock(return_value=True)), \
+                patch.object(uploader, "_save_form", slow_save):
+            assert asyncio.run(uploader.upload_painting({}, MagicMock(), timeout=0.01)) is True
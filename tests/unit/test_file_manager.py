@@ -24,10 +24,18 @@ class TestFileManager:
         # Test special characters
         assert fm.sanitize_filename("Title/With\\Slash") == "title_with_slash"
         assert fm.sanitize_filename("Title?!") == "title"
+        assert fm.sanitize_filename('The "Quoted" <Title>|') == "the_quoted_title"
         
         # Test leading/trailing underscores
         assert fm.sanitize_filename("  Spaces  ") == "spaces"
     
+    def test_sanitize_filename_non_ascii(self):
+        """Test that non-ASCII titles follow the same rules as ASCII ones."""
+        fm = FileManager()
+        
+        assert fm.sanitize_filename("Fachwerkhäuser: Bei Nacht?") == "fachwerkhäuser_bei_nacht"
+        assert fm.sanitize_filename("Café/Noir") == "café_noir"
+    
     def test_get_available_categories(self, mock_paintings_structure):
         """Test category discovery."""
         fm = FileManager()
@@ -68,6 +76,21 @@ class TestFileManager:
         assert pairs[0][0].name == "test001.jpg"
         assert pairs[0][1].name == "test001.jpg"
     
+    def test_find_painting_files_filters_entries(self, mock_paintings_structure, sample_image_file):
+        """Non-images and directories are skipped; missing instagram folder is fine."""
+        fm = FileManager()
+        fm.big_path = mock_paintings_structure["big"]
+        fm.instagram_path = mock_paintings_structure["instagram"] / "missing"
+        
+        big_folder = fm.big_path / "new-paintings"
+        (big_folder / "notes.txt").write_text("x")
+        (big_folder / "folder.jpg").mkdir()
+        (big_folder / "upper.JPG").write_bytes(sample_image_file.read_bytes())
+        
+        pairs = fm.find_painting_files("new-paintings")
+        
+        assert pairs == [(big_folder / "upper.JPG", None)]
+    
     def test_rename_painting_pair(self, mock_paintings_structure, sample_image_file):
         """Test renaming painting pairs."""
         fm = FileManager()
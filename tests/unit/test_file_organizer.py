@@ -79,6 +79,7 @@ class TestFileOrganizer:
         # Verify: Metadata updated and moved
         new_metadata = mock_paintings_structure["metadata"] / "test-collection" / "test_painting.json"
         assert new_metadata.exists()
+        assert organizer.organized == {"test_painting": new_metadata}
         
         with open(new_metadata, 'r') as f:
             updated_metadata = json.load(f)
@@ -156,6 +157,32 @@ class TestFileOrganizer:
         
         assert not success
         assert "no collection" in message.lower()
+    
+    def test_organize_all_reports_metadata_paths(self, mock_paintings_structure, sample_image_file, sample_metadata):
+        """Test that organize_all_new_paintings reports where metadata went."""
+        organizer = FileOrganizer(
+            mock_paintings_structure["big"],
+            mock_paintings_structure["instagram"],
+            mock_paintings_structure["metadata"]
+        )
+        
+        import shutil
+        big_file = mock_paintings_structure["big"] / "new-paintings" / "test.jpg"
+        shutil.copy(sample_image_file, big_file)
+        
+        metadata_dir = mock_paintings_structure["metadata"] / "new-paintings"
+        metadata_dir.mkdir(parents=True, exist_ok=True)
+        sample_metadata["files"]["big"] = str(big_file)
+        sample_metadata["files"]["instagram"] = None
+        with open(metadata_dir / "test.json", 'w') as f:
+            json.dump(sample_metadata, f)
+        
+        results = organizer.organize_all_new_paintings()
+        
+        assert results["success"] == 1
+        assert results["metadata_paths"] == {
+            "test": mock_paintings_structure["metadata"] / "test-collection" / "test.json"
+        }
 
 
 @pytest.mark.unit
@@ -0,0 +1,237 @@
+"""Tests for the Claude vision image analyzer."""
+
+import base64
+import json
+import pytest
+from io import BytesIO
+from unittest.mock import MagicMock
+
+from PIL import Image
+
+from src.app.services.image_analyzer import ImageAnalyzer
+from config.prompts import (
+    ANALYSIS_SYSTEM_BLOCKS,
+    DESCRIPTION_SYSTEM_BLOCKS,
+    TITLE_SYSTEM_BLOCKS,
+)
+
+
+def _response(text):
+    """Build a fake Anthropic message response with a single text block."""
+    message = MagicMock()
+    message.content = [MagicMock(text=text)]
+    return message
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    """Create ImageAnalyzer with a mocked Anthropic client and temp cache."""
+    a = ImageAnalyzer()
+    a.client = MagicMock()
+    a.cache_dir = tmp_path / "ai_cache"
+    return a
+
+
+class TestPromptCaching:
+    def test_system_blocks_marked_ephemeral(self):
+        for blocks in (TITLE_SYSTEM_BLOCKS, DESCRIPTION_SYSTEM_BLOCKS):
+            assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_titles_use_cached_system_block(self, analyzer, sample_image_file):
+        titles = [f"Title {i}" for i in range(10)]
+        analyzer.client.messages.create.return_value = _response(json.dumps(titles))
+
+        assert analyzer.generate_titles(sample_image_file) == titles
+        kwargs = analyzer.client.messages.create.call_args.kwargs
+        assert kwargs["system"] is TITLE_SYSTEM_BLOCKS
+
+    def test_description_details_in_user_turn(self, analyzer, sample_image_file):
+        analyzer.client.messages.create.return_value = _response(" A fine painting. ")
+
+        result = analyzer.generate_description(
+            sample_image_file, "Blue Harbour", "Oil on Canvas", "60cm x 80cm",
+            "new-paintings", user_notes="Painted at dawn",
+        )
+
+        assert result == "A fine painting."
+        kwargs = analyzer.client.messages.create.call_args.kwargs
+        assert kwargs["system"] is DESCRIPTION_SYSTEM_BLOCKS
+        user_text = kwargs["messages"][0]["content"][1]["text"]
+        assert "Blue Harbour" in user_text
+        assert "Painted at dawn" in user_text
+        assert "Blue Harbour" not in kwargs["system"][0]["text"]
+
+
+class TestResultCache:
+    def test_titles_cached_by_image_content(self, analyzer, sample_image_file, tmp_path):
+        titles = [f"Title {i}" for i in range(10)]
+        analyzer.client.messages.create.return_value = _response(json.dumps(titles))
+        analyzer.generate_titles(sample_image_file)
+
+        renamed = tmp_path / "renamed.jpg"
+        renamed.write_bytes(sample_image_file.read_bytes())
+
+        assert analyzer.generate_titles(renamed) == titles
+        assert analyzer.client.messages.create.call_count == 1
+
+    def test_cache_entries_sharded_by_key_prefix(self, analyzer, sample_image_file):
+        analyzer.client.messages.create.return_value = _response("Text")
+        analyzer.generate_description(sample_image_file, "T", "Oil", "60cm x 80cm", "new-paintings")
+
+        (entry,) = analyzer.cache_dir.glob("*/description_*.json")
+        assert entry.parent.name == entry.stem.split("_", 1)[1][:2]
+
+    def test_unparseable_titles_not_cached(self, analyzer, sample_image_file):
+        analyzer.client.messages.create.return_value = _response("not json")
+        analyzer.generate_titles(sample_image_file)
+        analyzer.generate_titles(sample_image_file)
+
+        assert analyzer.client.messages.create.call_count == 2
+
+    def test_description_cache_keyed_on_inputs(self, analyzer, sample_image_file):
+        analyzer.client.messages.create.return_value = _response("Text")
+        args = (sample_image_file, "Title", "Oil on Canvas", "60cm x 80cm", "new-paintings")
+
+        analyzer.generate_description(*args)
+        analyzer.generate_description(*args)
+        assert analyzer.client.messages.create.call_count == 1
+
+        analyzer.generate_description(*args, user_notes="different")
+        assert analyzer.client.messages.create.call_count == 2
+
+
+class TestFullAnalysis:
+    CATEGORIES = ["Imaginary Places", "Sea Beasties from Titan"]
+
+    def test_titles_and_category_from_one_call(self, analyzer, sample_image_file):
+        titles = [f"Title {i}" for i in range(10)]
+        analyzer.client.messages.create.return_value = _response(
+            json.dumps({"titles": titles, "category": "Imaginary Places"})
+        )
+
+        result = analyzer.analyze_full(sample_image_file, self.CATEGORIES)
+
+        assert result == {"titles": titles, "category": "Imaginary Places"}
+        kwargs = analyzer.client.messages.create.call_args.kwargs
+        assert kwargs["system"] is ANALYSIS_SYSTEM_BLOCKS
+        assert "Sea Beasties from Titan" in kwargs["messages"][0]["content"][1]["text"]
+
+        assert analyzer.analyze_full(sample_image_file, self.CATEGORIES) == result
+        assert analyzer.client.messages.create.call_count == 1
+
+    def test_unknown_category_dropped(self, analyzer, sample_image_file):
+        titles = [f"Title {i}" for i in range(10)]
+        analyzer.client.messages.create.return_value = _response(
+            json.dumps({"titles": titles, "category": "Still Life"})
+        )
+
+        assert analyzer.analyze_full(sample_image_file, self.CATEGORIES)["category"] is None
+
+    def test_fenced_json_parsed(self, analyzer, sample_image_file):
+        titles = [f"T{i}" for i in range(10)]
+        payload = json.dumps({"titles": titles, "category": "Imaginary Places"})
+        analyzer.client.messages.create.return_value = _response(
+            f"```json\n{payload}\n```"
+        )
+
+        result = analyzer.analyze_full(sample_image_file, self.CATEGORIES)
+
+        assert result == {"titles": titles, "category": "Imaginary Places"}
+
+    def test_json_with_surrounding_prose_parsed(self, analyzer, sample_image_file):
+        titles = [f"T{i}" for i in range(10)]
+        analyzer.client.messages.create.return_value = _response(
+            f"Here you go:\n{json.dumps({'titles': titles})}\nEnjoy!"
+        )
+
+        assert analyzer.analyze_full(sample_image_file, self.CATEGORIES)["titles"] == titles
+
+    def test_unparseable_response_falls_back_to_text(self, analyzer, sample_image_file):
+        analyzer.client.messages.create.return_value = _response("One\nTwo")
+
+        result = analyzer.analyze_full(sample_image_file, self.CATEGORIES)
+
+        assert result["titles"][:2] == ["One", "Two"]
+        assert len(result["titles"]) == 10
+        assert result["category"] is None
+
+
+class TestDescriptionStreaming:
+    def test_streams_chunks_to_callback(self, analyzer, sample_image_file):
+        stream = analyzer.client.messages.stream.return_value.__enter__.return_value
+        stream.text_stream = iter(["A quiet ", "harbour."])
+        stream.get_final_text.return_value = "A quiet harbour."
+        chunks = []
+
+        result = analyzer.generate_description(
+            sample_image_file, "Title", "Oil", "60cm x 80cm", "new-paintings",
+            on_text=chunks.append,
+        )
+
+        assert chunks == ["A quiet ", "harbour."]
+        assert result == "A quiet harbour."
+        analyzer.client.messages.create.assert_not_called()
+
+    def test_cached_description_sent_to_callback(self, analyzer, sample_image_file):
+        analyzer.client.messages.create.return_value = _response("Cached text")
+        args = (sample_image_file, "Title", "Oil", "60cm x 80cm", "new-paintings")
+        analyzer.generate_description(*args)
+        chunks = []
+
+        assert analyzer.generate_description(*args, on_text=chunks.append) == "Cached text"
+        assert chunks == ["Cached text"]
+        analyzer.client.messages.stream.assert_not_called()
+
+
+class TestImageDownscaling:
+    def test_small_image_sent_unchanged(self, analyzer, sample_image_file):
+        block = analyzer._image_block(sample_image_file)
+
+        assert block["source"]["media_type"] == "image/jpeg"
+        assert base64.b64decode(block["source"]["data"]) == sample_image_file.read_bytes()
+
+    def test_large_image_downscaled_to_jpeg(self, analyzer, tmp_path):
+        big_png = tmp_path / "big.png"
+        Image.new("RGBA", (3000, 1500), color="red").save(big_png)
+
+        block = analyzer._image_block(big_png)
+
+        assert block["source"]["media_type"] == "image/jpeg"
+        with Image.open(BytesIO(base64.b64decode(block["source"]["data"]))) as img:
+            assert img.format == "JPEG"
+            assert img.size == (1024, 512)
+
+    def test_exif_orientation_applied_when_downscaled(self, analyzer, tmp_path):
+        rotated = tmp_path / "rotated.jpg"
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Orientation: rotate 90° clockwise to display
+        Image.new("RGB", (3000, 1500), color="red").save(rotated, exif=exif)
+
+        block = analyzer._image_block(rotated)
+
+        with Image.open(BytesIO(base64.b64decode(block["source"]["data"]))) as img:
+            assert img.size == (512, 1024)
+            assert img.getexif().get(0x0112, 1) == 1
+
+    def test_prepared_image_reused_across_calls(self, analyzer, sample_image_file):
+        analyzer.client.messages.create.return_value = _response("Text")
+
+        analyzer.generate_description(sample_image_file, "A", "Oil", "60cm x 80cm", "new-paintings")
+        analyzer.generate_description(sample_image_file, "B", "Oil", "60cm x 80cm", "new-paintings")
+
+        info = analyzer._prepared_images.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        first, second = (
+            call.kwargs["messages"][0]["content"][0]
+            for call in analyzer.client.messages.create.call_args_list
+        )
+        assert first is second
+
+    def test_modified_image_prepared_again(self, analyzer, tmp_path):
+        path = tmp_path / "painting.png"
+        Image.new("RGB", (10, 10), color="red").save(path)
+        first = analyzer._load_image(path)
+
+        Image.new("RGB", (20, 20), color="blue").save(path)
+
+        assert analyzer._load_image(path)[0] != first[0]
@@ -0,0 +1,75 @@
+"""
+Unit tests for metadata_manager module.
+"""
+
+import dataclasses
+import pytest
+
+from src.app.services.metadata_manager import MetadataManager, PaintingDetails
+
+
+def _details(**overrides):
+    """Build valid PaintingDetails, optionally overriding fields."""
+    values = dict(
+        width=60.0,
+        height=80.0,
+        depth=None,
+        dimension_unit="cm",
+        dimensions_formatted="60.0cm x 80.0cm",
+        substrate="Canvas",
+        medium="Oil",
+        subject="Landscape",
+        style="Realism",
+        collection="Oil Paintings",
+        price_eur=450.0,
+        creation_date="2024-05-01",
+    )
+    values.update(overrides)
+    return PaintingDetails(**values)
+
+
+@pytest.mark.unit
+class TestPaintingDetails:
+    """Test PaintingDetails dataclass."""
+
+    def test_unknown_option_rejected(self):
+        """Test that options outside the configured lists are rejected."""
+        with pytest.raises(ValueError, match="medium"):
+            _details(medium="Crayon")
+
+    def test_frozen(self):
+        """Test that details cannot be changed after creation."""
+        details = _details()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            details.price_eur = 0.0
+
+    def test_create_metadata_layout(self, temp_dir, monkeypatch):
+        """Test that create_metadata keeps the existing JSON layout."""
+        monkeypatch.setattr(
+            "src.app.services.metadata_manager.METADATA_OUTPUT_PATH", temp_dir
+        )
+        manager = MetadataManager()
+
+        metadata = manager.create_metadata(
+            filename_base="blue_harbour",
+            category="new-paintings",
+            big_file_path=temp_dir / "blue_harbour.jpg",
+            instagram_file_path=None,
+            selected_title="Blue Harbour",
+            all_titles=["Blue Harbour"],
+            description="A harbour.",
+            details=_details(),
+        )
+
+        assert metadata["dimensions"] == {
+            "width": 60.0,
+            "height": 80.0,
+            "depth": None,
+            "unit": "cm",
+            "formatted": "60.0cm x 80.0cm",
+        }
+        assert metadata["medium"] == "Oil"
+        assert metadata["collection"] == "Oil Paintings"
+        assert metadata["price_eur"] == 450.0
+        assert metadata["creation_date"] == "2024-05-01"
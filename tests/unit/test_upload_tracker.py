@@ -45,6 +45,23 @@ class TestUploadTracker:
         assert "sunset_painting" in tracker.data["paintings"]
         assert tracker.data["paintings"]["sunset_painting"]["uploads"]["FASO"] == False
     
+    def test_add_paintings_saves_once(self, temp_dir, monkeypatch):
+        """Test bulk adding paintings writes the tracker file once."""
+        tracker_file = temp_dir / "upload_status.json"
+        tracker = UploadTracker(tracker_file)
+        saves = []
+        original_save = tracker._save_tracker
+        monkeypatch.setattr(tracker, "_save_tracker", lambda: saves.append(1) or original_save())
+        
+        tracker.add_paintings([
+            ("painting_a", "/path/to/a.json"),
+            ("painting_b", "/path/to/b.json"),
+        ])
+        
+        assert len(saves) == 1
+        assert set(UploadTracker(tracker_file).data["paintings"]) == {"painting_a", "painting_b"}
+        assert not (temp_dir / "upload_status.json.tmp").exists()
+    
     def test_mark_uploaded(self, temp_dir):
         """Test marking a painting as uploaded."""
         tracker_file = temp_dir / "upload_status.json"